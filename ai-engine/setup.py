@@ -36,6 +36,12 @@ setup(
         "ocr": [
             "pytesseract>=0.3.10",
         ],
+        "fast-pdf": [
+            "pymupdf>=1.24.0",
+        ],
+        "fast-json": [
+            "orjson>=3.9.0",
+        ],
         "vectordb": [
             "chromadb>=0.4.0",
         ],
@@ -33,6 +33,7 @@ from src.session_manager.schemas import (
     ProgressAnalytics,
     LearningPath
 )
+from src.utils.llm_client import LLMClient
 
 
 class PrepWiseAPI:
@@ -61,9 +62,16 @@ class PrepWiseAPI:
     def __init__(self):
         """Initialize PrepWise AI API with all components"""
         self.resume_parser = ResumeParser()
-        self.question_generator = QuestionGenerator()
-        self.answer_evaluator = AnswerEvaluator()
-        self.session_manager = SessionManager()
+        
+        # One client (and connection pool) for question generation and evaluation,
+        # shared with the session manager instead of each building its own
+        llm_client = LLMClient()
+        self.question_generator = QuestionGenerator(llm_client=llm_client)
+        self.answer_evaluator = AnswerEvaluator(llm_client=llm_client)
+        self.session_manager = SessionManager(
+            question_generator=self.question_generator,
+            answer_evaluator=self.answer_evaluator
+        )
     
     # ==================== Resume Operations ====================
     
@@ -3,7 +3,7 @@ Answer Evaluator
 Evaluates candidate answers and generates detailed feedback
 """
 
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Tuple, Union
 import re
 import uuid
 from datetime import datetime
@@ -21,6 +21,7 @@ from src.evaluator.schemas import (
     ScoreLevel
 )
 from src.utils.llm_client import LLMClient
+from src.utils.rate_limiter import RateLimitExceeded
 
 
 class AnswerEvaluator:
@@ -84,12 +85,6 @@ class AnswerEvaluator:
         """
         start_time = time.time()
         
-        # Generate evaluation ID
-        eval_id = self._generate_evaluation_id()
-        
-        # Determine question ID
-        question_id = request.question_id or f"q_{uuid.uuid4().hex[:8]}"
-        
         # Build evaluation prompt
         prompt = self._build_evaluation_prompt(request)
         
@@ -100,6 +95,27 @@ class AnswerEvaluator:
                 temperature=0.3,
                 max_tokens=1200
             )
+        except Exception as e:
+            llm_response = e
+        
+        return self._build_evaluation(request, llm_response, start_time)
+    
+    def _build_evaluation(
+        self,
+        request: EvaluationRequest,
+        llm_response: Union[Dict[str, Any], Exception],
+        start_time: float
+    ) -> AnswerEvaluation:
+        """Turn an LLM evaluation response, or the error it raised, into an AnswerEvaluation"""
+        # Generate evaluation ID
+        eval_id = self._generate_evaluation_id()
+        
+        # Determine question ID
+        question_id = request.question_id or f"q_{uuid.uuid4().hex[:8]}"
+        
+        try:
+            if isinstance(llm_response, Exception):
+                raise llm_response
             
             # Parse LLM response
             evaluation = self._parse_llm_evaluation(
@@ -109,6 +125,9 @@ class AnswerEvaluator:
                 question_id
             )
             
+        except RateLimitExceeded:
+            # Over budget is the caller's to report, not a reason to fall back
+            raise
         except Exception as e:
             print(f"Error getting LLM evaluation: {e}")
             # Fallback to rule-based evaluation
@@ -140,16 +159,28 @@ class AnswerEvaluator:
         Returns:
             Tuple of (list of evaluations, optional session summary)
         """
-        evaluations = []
+        start_time = time.time()
         
-        # Evaluate each answer
         for eval_request in request.evaluations:
             eval_request.session_id = request.session_id
             if request.candidate_context:
                 eval_request.candidate_context = request.candidate_context
-            
-            evaluation = self.evaluate_answer(eval_request)
-            evaluations.append(evaluation)
+        
+        # Evaluate every answer concurrently; a failed call falls back per answer
+        try:
+            llm_responses = self.llm_client.generate_json_batch(
+                [self._build_evaluation_prompt(r) for r in request.evaluations],
+                temperature=0.3,
+                max_tokens=1200,
+                return_exceptions=True
+            )
+        except Exception as e:
+            llm_responses = [e] * len(request.evaluations)
+        
+        evaluations = [
+            self._build_evaluation(eval_request, llm_response, start_time)
+            for eval_request, llm_response in zip(request.evaluations, llm_responses)
+        ]
         
         # Generate session summary if requested
         summary = None
@@ -571,7 +602,8 @@ Be constructive, specific, and actionable in your feedback."""
             strengths=strengths,
             weaknesses=weaknesses,
             suggestions=suggestions,
-            summary=f"Answer demonstrates {'good' if overall_score >= 70 else 'fair'} understanding. Score based on length, coverage of key points, and structure."
+            summary=f"Answer demonstrates {'good' if overall_score >= 70 else 'fair'} understanding. Score based on length, coverage of key points, and structure.",
+            is_fallback=True
         )
         
         return evaluation
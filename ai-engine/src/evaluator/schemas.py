@@ -131,6 +131,7 @@ class AnswerEvaluation(BaseModel):
     evaluation_timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
     evaluator_model: Optional[str] = Field(None, description="Model used for evaluation")
     evaluation_duration_seconds: Optional[float] = None
+    is_fallback: bool = Field(False, description="Rule-based score used because the LLM call failed")
     
     # Comparison
     expected_answer_points: List[str] = Field(default_factory=list)
@@ -3,10 +3,16 @@ Question Generator
 Generates tailored interview questions based on role, level, and resume
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+import asyncio
 import random
 from datetime import datetime
-import os
+from functools import lru_cache
+from pathlib import Path
+import json
+import logging
+import re
+import uuid
 
 from src.question_generator.schemas import (
     InterviewQuestion,
@@ -16,17 +22,38 @@ from src.question_generator.schemas import (
     DifficultyLevel
 )
 from src.utils.llm_client import LLMClient
+from src.utils.rate_limiter import RateLimitExceeded
 
+try:
+    import orjson  # Optional: pip install "ai-engine[fast-json]"
+except ImportError:
+    orjson = None
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# LLMs often wrap the JSON array in ```json fences or a short preamble
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+_DURATION_RE = re.compile(r"(\d+)")
+
+# ai-engine/prompts, resolved once at import
+_PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
+
+
+def _extract_json_array(response: str) -> str:
+    """Return the JSON array embedded in an LLM response (or the response itself)"""
+    match = _JSON_ARRAY_RE.search(response)
+    return match.group(0) if match else response
+
+
+@lru_cache(maxsize=None)
 def load_prompt(prompt_name: str) -> str:
-    """Load a prompt template from the prompts directory"""
+    """Load a prompt template from the prompts directory (read once per process)"""
     try:
-        prompt_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "prompts",
-            f"{prompt_name}.txt"
-        )
-        if os.path.exists(prompt_path):
+        prompt_path = _PROMPTS_DIR / f"{prompt_name}.txt"
+        if prompt_path.exists():
             with open(prompt_path, 'r') as f:
                 content = f.read().strip()
                 if content:
@@ -54,8 +81,8 @@ class QuestionGenerator:
         try:
             self.technical_prompt = load_prompt("technical_questions")
             self.behavioral_prompt = load_prompt("behavioral_questions")
-        except Exception as e:
-            print(f"Warning: Could not load prompts: {e}")
+        except Exception:
+            logger.warning("Could not load prompts", exc_info=True)
             self.technical_prompt = None
             self.behavioral_prompt = None
     
@@ -72,6 +99,80 @@ class QuestionGenerator:
         Returns:
             QuestionSet with generated questions
         """
+        jobs = self._llm_question_jobs(request)
+        
+        # Generate technical and behavioral questions in one concurrent batch
+        responses = []
+        if jobs:
+            try:
+                responses = self.llm_client.generate_batch(
+                    [prompt for _, _, prompt, _, _ in jobs],
+                    overrides=[settings for _, _, _, _, settings in jobs],
+                    return_exceptions=True
+                )
+            except Exception as e:
+                responses = [e] * len(jobs)
+        
+        return self._build_question_set(request, jobs, responses)
+    
+    async def agenerate_questions(
+        self,
+        request: QuestionGenerationRequest
+    ) -> QuestionSet:
+        """
+        Async variant of generate_questions(), for callers already in an event loop
+        
+        Several requests can be generated concurrently with
+        asyncio.gather(*(generator.agenerate_questions(r) for r in requests)).
+        
+        Args:
+            request: Question generation request with specifications
+            
+        Returns:
+            QuestionSet with generated questions
+        """
+        jobs = self._llm_question_jobs(request)
+        
+        responses = await asyncio.gather(
+            *(
+                self.llm_client.generate_async(prompt=prompt, **settings)
+                for _, _, prompt, _, settings in jobs
+            ),
+            return_exceptions=True
+        )
+        
+        return self._build_question_set(request, jobs, responses)
+    
+    def _llm_question_jobs(self, request: QuestionGenerationRequest) -> List[Tuple]:
+        """(type, count, prompt, fallback, settings) for each LLM-generated type the request asks for"""
+        jobs = []
+        if request.num_technical > 0:
+            context = self._build_technical_context(request)
+            jobs.append((
+                QuestionType.TECHNICAL,
+                request.num_technical,
+                self._build_technical_prompt(context, request.num_technical),
+                self._get_fallback_technical_questions,
+                {"temperature": 0.8, "max_tokens": 2000}
+            ))
+        if request.num_behavioral > 0:
+            context = self._build_behavioral_context(request)
+            jobs.append((
+                QuestionType.BEHAVIORAL,
+                request.num_behavioral,
+                self._build_behavioral_prompt(context, request.num_behavioral),
+                self._get_fallback_behavioral_questions,
+                {"temperature": 0.7, "max_tokens": 1500}
+            ))
+        return jobs
+    
+    def _build_question_set(
+        self,
+        request: QuestionGenerationRequest,
+        jobs: List[Tuple],
+        responses: List[Any]
+    ) -> QuestionSet:
+        """Assemble the question set from the LLM responses (or errors) for each job"""
         session_id = self._generate_session_id()
         
         question_set = QuestionSet(
@@ -82,22 +183,24 @@ class QuestionGenerator:
             created_at=datetime.now().isoformat()
         )
         
-        # Generate technical questions
-        if request.num_technical > 0:
-            technical_questions = self._generate_technical_questions(
-                request=request,
-                count=request.num_technical
-            )
-            for q in technical_questions:
-                question_set.add_question(q)
-        
-        # Generate behavioral questions
-        if request.num_behavioral > 0:
-            behavioral_questions = self._generate_behavioral_questions(
-                request=request,
-                count=request.num_behavioral
-            )
-            for q in behavioral_questions:
+        # Add technical and behavioral questions
+        for (question_type, count, _, fallback, _), response in zip(jobs, responses):
+            if isinstance(response, RateLimitExceeded):
+                # Over budget is the caller's to report, not a reason to fall back
+                raise response
+            if isinstance(response, Exception):
+                logger.error(
+                    "Error generating %s questions", question_type.value, exc_info=response
+                )
+                # Fallback to template questions
+                questions = fallback(request, count)
+            else:
+                questions = self._parse_llm_response(
+                    response,
+                    question_type,
+                    request
+                )[:count]
+            for q in questions:
                 question_set.add_question(q)
         
         # Generate situational questions
@@ -120,69 +223,6 @@ class QuestionGenerator:
         
         return question_set
     
-    def _generate_technical_questions(
-        self,
-        request: QuestionGenerationRequest,
-        count: int
-    ) -> List[InterviewQuestion]:
-        """Generate technical interview questions"""
-        
-        # Build context from request
-        context = self._build_technical_context(request)
-        
-        # Use LLM to generate questions
-        prompt = self._build_technical_prompt(context, count)
-        
-        try:
-            response = self.llm_client.generate(
-                prompt=prompt,
-                temperature=0.8,
-                max_tokens=2000
-            )
-            
-            # Parse response into questions
-            questions = self._parse_llm_response(
-                response,
-                QuestionType.TECHNICAL,
-                request
-            )
-            
-            return questions[:count]
-            
-        except Exception as e:
-            print(f"Error generating technical questions: {e}")
-            # Fallback to template questions
-            return self._get_fallback_technical_questions(request, count)
-    
-    def _generate_behavioral_questions(
-        self,
-        request: QuestionGenerationRequest,
-        count: int
-    ) -> List[InterviewQuestion]:
-        """Generate behavioral interview questions"""
-        
-        context = self._build_behavioral_context(request)
-        prompt = self._build_behavioral_prompt(context, count)
-        
-        try:
-            response = self.llm_client.generate(
-                prompt=prompt,
-                temperature=0.7,
-                max_tokens=1500
-            )
-            
-            questions = self._parse_llm_response(
-                response,
-                QuestionType.BEHAVIORAL,
-                request
-            )
-            
-            return questions[:count]
-            
-        except Exception as e:
-            print(f"Error generating behavioral questions: {e}")
-            return self._get_fallback_behavioral_questions(request, count)
-    
     def _generate_situational_questions(
         self,
         request: QuestionGenerationRequest,
@@ -466,9 +506,7 @@ Format as JSON array with keys: question, difficulty, category, skills_tested (a
         questions = []
         
         try:
-            import json
-            import re
-            data = json.loads(response)
+            data = _json_loads(_extract_json_array(response))
             
             if isinstance(data, list):
                 for item in data:
@@ -481,7 +519,7 @@ Format as JSON array with keys: question, difficulty, category, skills_tested (a
                     duration = item.get("duration", 5)
                     if isinstance(duration, str):
                         # Extract number from strings like "10 minutes", "5 min", "7"
-                        duration_match = re.search(r'(\d+)', duration)
+                        duration_match = _DURATION_RE.search(duration)
                         duration = int(duration_match.group(1)) if duration_match else 5
                     
                     question = InterviewQuestion(
@@ -496,10 +534,8 @@ Format as JSON array with keys: question, difficulty, category, skills_tested (a
                     )
                     questions.append(question)
         
-        except Exception as e:
-            print(f"Error parsing LLM response: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error parsing LLM response")
         
         return questions
     
@@ -599,7 +635,6 @@ Format as JSON array with keys: question, difficulty, category, skills_tested (a
     
     def _generate_session_id(self) -> str:
         """Generate unique session ID"""
-        import uuid
         return f"sess_{uuid.uuid4().hex[:12]}"
     
     def generate_follow_up(
@@ -627,6 +662,6 @@ Respond with just the follow-up question."""
                 max_tokens=200
             )
             return follow_up.strip()
-        except Exception as e:
-            print(f"Error generating follow-up: {e}")
+        except Exception:
+            logger.exception("Error generating follow-up")
             return random.choice(original_question.follow_up_questions) if original_question.follow_up_questions else "Can you elaborate on that?"
@@ -3,28 +3,137 @@ Text Extractors
 Extract text from various resume document formats (PDF, DOCX)
 """
 
-import PyPDF2
-from docx import Document
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional
+import os
 import re
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import pymupdf  # Optional: pip install "ai-engine[fast-pdf]"
+except ImportError:
+    pymupdf = None
+
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+PDF_BACKEND_PYMUPDF = "pymupdf"
+PDF_BACKEND_PYPDF2 = "pypdf2"
+# PyMuPDF extracts text several times faster than PyPDF2, use it when installed
+DEFAULT_PDF_BACKEND = PDF_BACKEND_PYMUPDF if pymupdf else PDF_BACKEND_PYPDF2
+
+# Below this page count a caller's process pool costs more than it saves
+PARALLEL_PDF_MIN_PAGES = 3
+# Page ranges a document is split into on a caller's pool
+MAX_PDF_WORKERS = 4
+
+# Control characters removed by TextExtractor.clean_text (newline, tab and CR kept)
+_CTRL_TABLE = dict.fromkeys(
+    [*range(0x00, 0x09), *range(0x0B, 0x0D), *range(0x0E, 0x20), 0x7F]
+)
+
+# Patterns used by TextExtractor.clean_text
+_SPACES_RE = re.compile(r' +')
+_NL_RE = re.compile(r'\n{3,}')
+
+
+def _iter_docx_text(doc) -> Iterator[str]:
+    """Yield the non-empty paragraph and table cell texts of a DOCX document"""
+    for para in doc.paragraphs:
+        para_text = para.text
+        if para_text.strip():
+            yield para_text
+
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                # cell.text walks the cell XML on every access, read it once
+                cell_text = cell.text
+                if cell_text.strip():
+                    yield cell_text
+
+
+def _release_pypdf2_page(page) -> None:
+    """Drop the decoded content streams PyPDF2 caches on a page once its text is extracted"""
+    contents = page.get("/Contents")
+    if contents is None:
+        return
+
+    contents = contents.get_object()
+    streams = contents if isinstance(contents, list) else [contents]
+    for stream in streams:
+        stream = stream.get_object()
+        if getattr(stream, "decoded_self", None) is not None:
+            stream.decoded_self = None
+
+
+def _iter_pypdf2_page_texts(pdf_reader) -> Iterator[str]:
+    """Yield the text of each page, releasing page content as it goes"""
+    for page in pdf_reader.pages:
+        yield page.extract_text()
+        _release_pypdf2_page(page)
+
+
+def _iter_logged_page_texts(page_texts: Iterable[str]) -> Iterator[str]:
+    """Yield the non-empty page texts, logging pages without text"""
+    for page_num, page_text in enumerate(page_texts, 1):
+        if page_text:
+            logger.debug("Extracted %d chars from page %d", len(page_text), page_num)
+            yield page_text
+        else:
+            logger.warning("No text extracted from page %d", page_num)
+
+
+def _extract_pdf_pages(file_path: str, start: int, stop: int, backend: str) -> List[str]:
+    """Extract text from pages [start, stop) of a PDF, opening it once (process pool worker)"""
+    # Workers get the path rather than a document object and reopen it themselves
+    if backend == PDF_BACKEND_PYMUPDF:
+        with pymupdf.open(file_path) as doc:
+            return [doc[page_index].get_text("text") for page_index in range(start, stop)]
+
+    import PyPDF2
+
+    with open(file_path, 'rb') as file:
+        pages = PyPDF2.PdfReader(file).pages
+        return [pages[page_index].extract_text() for page_index in range(start, stop)]
+
+
+def _extract_pdf_pages_parallel(
+    file_path: str, page_count: int, backend: str, executor: Executor
+) -> List[str]:
+    """Extract all pages of a PDF on the caller's executor, one page range per task, in page order"""
+    range_size = -(-page_count // MAX_PDF_WORKERS)
+    futures = [
+        executor.submit(
+            _extract_pdf_pages, file_path, start, min(start + range_size, page_count), backend
+        )
+        for start in range(0, page_count, range_size)
+    ]
+    return [page_text for future in futures for page_text in future.result()]
 
 
 class TextExtractor:
     """Extract text from various document formats"""
 
     @staticmethod
-    def extract_from_pdf(file_path: str) -> str:
+    def extract_from_pdf(
+        file_path: str,
+        backend: Optional[str] = None,
+        executor: Optional[Executor] = None
+    ) -> str:
         """
-        Extract text from PDF using PyPDF2
+        Extract text from PDF using PyMuPDF (if installed) or PyPDF2
+
+        Pages are extracted sequentially unless the caller passes a process
+        pool, which documents with PARALLEL_PDF_MIN_PAGES or more pages are
+        then split across. No pool is created here, so nothing forks per
+        document on a request path or inside another worker.
 
         Args:
             file_path: Path to PDF file
+            backend: "pymupdf" or "pypdf2" (defaults to DEFAULT_PDF_BACKEND)
+            executor: Process pool to spread long documents across (optional)
 
         Returns:
             Extracted text as string
@@ -32,30 +141,53 @@ class TextExtractor:
         Raises:
             ValueError: If PDF extraction fails
         """
-        text = []
-
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+        backend = (backend or DEFAULT_PDF_BACKEND).lower()
+        if backend == PDF_BACKEND_PYMUPDF and pymupdf is None:
+            logger.warning("PyMuPDF is not installed, falling back to PyPDF2")
+            backend = PDF_BACKEND_PYPDF2
+        elif backend not in (PDF_BACKEND_PYMUPDF, PDF_BACKEND_PYPDF2):
+            raise ValueError(f"Unsupported PDF backend: {backend}")
 
-                logger.info(f"Extracting text from PDF: {file_path}")
-                logger.info(f"Total pages: {len(pdf_reader.pages)}")
+        combined_text = None
 
-                for page_num, page in enumerate(pdf_reader.pages, 1):
-                    page_text = page.extract_text()
-                    if page_text:
-                        text.append(page_text)
-                        logger.debug(f"Extracted {len(page_text)} chars from page {page_num}")
-                    else:
-                        logger.warning(f"No text extracted from page {page_num}")
+        try:
+            logger.info(f"Extracting text from PDF: {file_path}")
+
+            # Pages are streamed one by one while the file is open, unless a
+            # long document can go to the caller's pool
+            if backend == PDF_BACKEND_PYMUPDF:
+                if not os.path.isfile(file_path):
+                    raise FileNotFoundError(file_path)
+                with pymupdf.open(file_path) as doc:
+                    page_count = doc.page_count
+                    logger.info("Total pages: %d (backend: %s)", page_count, backend)
+                    if executor is None or page_count < PARALLEL_PDF_MIN_PAGES:
+                        combined_text = "\n".join(_iter_logged_page_texts(
+                            page.get_text("text") for page in doc
+                        ))
+            else:
+                import PyPDF2
+
+                with open(file_path, 'rb') as file:
+                    pdf_reader = PyPDF2.PdfReader(file)
+                    page_count = len(pdf_reader.pages)
+                    logger.info("Total pages: %d (backend: %s)", page_count, backend)
+                    if executor is None or page_count < PARALLEL_PDF_MIN_PAGES:
+                        combined_text = "\n".join(_iter_logged_page_texts(
+                            _iter_pypdf2_page_texts(pdf_reader)
+                        ))
+
+            # Page extraction is CPU-bound, so spread longer documents across processes
+            if combined_text is None:
+                combined_text = "\n".join(_iter_logged_page_texts(
+                    _extract_pdf_pages_parallel(file_path, page_count, backend, executor)
+                ))
 
         except FileNotFoundError:
             raise ValueError(f"PDF file not found: {file_path}")
         except Exception as e:
             raise ValueError(f"Error extracting PDF: {str(e)}")
 
-        combined_text = "\n".join(text)
-
         if not combined_text.strip():
             logger.warning("PDF extraction resulted in empty text - may be scanned/image-based")
             raise ValueError(
@@ -80,25 +212,16 @@ class TextExtractor:
         Raises:
             ValueError: If DOCX extraction fails
         """
+        # Imported on first use: python-docx pulls in lxml, which is slow to load
+        from docx import Document
+
         try:
             logger.info(f"Extracting text from DOCX: {file_path}")
 
             doc = Document(file_path)
-            text = []
-
-            # Extract from paragraphs
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    text.append(para.text)
-
-            # Extract from tables (if any)
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text.append(cell.text)
 
-            combined_text = "\n".join(text)
+            # Paragraphs first, then table cells (if any)
+            combined_text = "\n".join(_iter_docx_text(doc))
 
             if not combined_text.strip():
                 raise ValueError("No text extracted from DOCX file")
@@ -130,17 +253,16 @@ class TextExtractor:
             return ""
 
         # Remove null bytes and control characters (except newlines and tabs)
-        text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
+        text = text.translate(_CTRL_TABLE)
 
         # Replace multiple spaces with single space (but preserve newlines)
-        text = re.sub(r' +', ' ', text)
+        text = _SPACES_RE.sub(' ', text)
 
         # Replace multiple newlines with double newline (paragraph separation)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _NL_RE.sub('\n\n', text)
 
         # Remove spaces at the beginning and end of lines
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
+        text = '\n'.join([line.strip() for line in text.split('\n')])
 
         # Strip leading/trailing whitespace
         text = text.strip()
@@ -148,12 +270,13 @@ class TextExtractor:
         return text
 
     @staticmethod
-    def extract_text(file_path: str) -> str:
+    def extract_text(file_path: str, executor: Optional[Executor] = None) -> str:
         """
         Universal text extractor - auto-detects format and extracts text
 
         Args:
             file_path: Path to resume file (PDF or DOCX)
+            executor: Process pool for long PDFs, see extract_from_pdf (optional)
 
         Returns:
             Cleaned extracted text
@@ -181,7 +304,7 @@ class TextExtractor:
 
         # Extract based on format
         if suffix == '.pdf':
-            raw_text = TextExtractor.extract_from_pdf(file_path)
+            raw_text = TextExtractor.extract_from_pdf(file_path, executor=executor)
         elif suffix in ['.docx', '.doc']:
             if suffix == '.doc':
                 logger.warning(
@@ -219,15 +342,17 @@ class TextExtractor:
             >>> stats = TextExtractor.get_text_stats(text)
             >>> print(stats['word_count'])
         """
-        lines = text.split('\n')
-        words = text.split()
+        # Count lines without building a list of them; str.split() is still the
+        # fastest word count available in pure Python
+        line_count = text.count('\n') + 1
+        word_count = len(text.split())
 
         return {
             'character_count': len(text),
-            'word_count': len(words),
-            'line_count': len(lines),
-            'avg_words_per_line': len(words) / len(lines) if lines else 0,
-            'is_empty': len(text.strip()) == 0
+            'word_count': word_count,
+            'line_count': line_count,
+            'avg_words_per_line': word_count / line_count,
+            'is_empty': not text or text.isspace()
         }
 
 
@@ -255,7 +380,6 @@ def extract_and_analyze(file_path: str) -> tuple[str, dict]:
     Returns:
         Tuple of (extracted_text, statistics)
     """
-    extractor = TextExtractor()
-    text = extractor.extract_text(file_path)
-    stats = extractor.get_text_stats(text)
+    text = TextExtractor.extract_text(file_path)
+    stats = TextExtractor.get_text_stats(text)
     return text, stats
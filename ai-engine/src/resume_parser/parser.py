@@ -3,18 +3,200 @@ Resume Parser
 LLM-based resume parsing to extract structured data from resume text
 """
 
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable, Tuple
+import hashlib
 import logging
 import json
+import re
+import threading
 
 from src.utils.llm_client import LLMClient
+from src.utils.rate_limiter import RateLimitExceeded
 from src.resume_parser.extractors import TextExtractor
 from src.resume_parser.schemas import ParsedResume
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Top-level ParsedResume fields requested by each parallel LLM call in decomposed mode
+SECTION_FIELDS = {
+    "basic_info": ["contact", "skills"],
+    "work_experience": ["experience", "total_years_experience"],
+    "education_plus_rest": [
+        "education", "projects", "certifications", "leadership",
+        "awards", "publications", "volunteer"
+    ],
+}
+
+# Resumes longer than this are split at their section headings so each parallel
+# call only receives the part of the resume it extracts from
+LONG_RESUME_CHARS = 8000
+
+# Common resume headings and the decomposed section that extracts from them
+_SECTION_HEADINGS = {
+    **dict.fromkeys([
+        "SUMMARY", "PROFESSIONAL SUMMARY", "PROFILE", "OBJECTIVE", "CONTACT",
+        "SKILLS", "TECHNICAL SKILLS", "CORE COMPETENCIES",
+    ], "basic_info"),
+    **dict.fromkeys([
+        "EXPERIENCE", "WORK EXPERIENCE", "PROFESSIONAL EXPERIENCE", "EMPLOYMENT",
+        "EMPLOYMENT HISTORY", "WORK HISTORY", "INTERNSHIPS",
+    ], "work_experience"),
+    **dict.fromkeys([
+        "EDUCATION", "PROJECTS", "CERTIFICATIONS", "LEADERSHIP", "AWARDS",
+        "HONORS", "HONORS & AWARDS", "PUBLICATIONS", "VOLUNTEER", "VOLUNTEERING",
+        "VOLUNTEER EXPERIENCE", "ACTIVITIES",
+    ], "education_plus_rest"),
+}
+# A line-numbered line holding nothing but a short heading, e.g. "[14] Work Experience:"
+_HEADING_RE = re.compile(r"^\[\d+\] ([A-Za-z][A-Za-z &/]{2,40}?)\s*:?$")
+
+_SECTION_INSTRUCTION = """
+
+FOCUS FOR THIS REQUEST:
+Extract ONLY these top-level fields: {fields}
+Return a JSON object containing only those keys."""
+
+# Project descriptions come back as line ranges and are copied from the resume locally,
+# which keeps long verbatim text out of the LLM output
+_LINE_POINTER_INSTRUCTION = """
+
+LINE REFERENCES:
+Each resume line above is prefixed with its line number in square brackets, e.g. "[12] ".
+For projects[*].description do NOT copy the text. Instead return {{"lines": [start, end]}}
+with the first and last line numbers (inclusive) that make up the description."""
+
+
+def _split_prompt_template(template: str) -> Tuple[str, str]:
+    """
+    Split a .format-style template around its {resume_text} placeholder
+
+    The resume text is spliced between the two halves by plain concatenation,
+    so braces in the resume never reach the format parser.
+
+    Args:
+        template: Prompt template containing a single {resume_text} field
+
+    Returns:
+        Tuple of (prefix, suffix) with {{ }} escapes already resolved
+    """
+    prefix, suffix = template.split("{resume_text}", 1)
+    unescape = lambda part: part.replace("{{", "{").replace("}}", "}")
+    return unescape(prefix), unescape(suffix)
+
+
+@lru_cache(maxsize=None)
+def _response_schema(fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+    """
+    JSON schema for an LLM parsing response, used to constrain decoding
+
+    Args:
+        fields: Top-level ParsedResume fields to include (all when None)
+
+    Returns:
+        ParsedResume JSON schema limited to fields, with project descriptions
+        given as line ranges as requested by _LINE_POINTER_INSTRUCTION
+    """
+    schema = ParsedResume.model_json_schema()
+    schema.pop("example", None)
+    if fields is not None:
+        schema["properties"] = {field: schema["properties"][field] for field in fields}
+        schema["required"] = [field for field in schema.get("required", []) if field in fields]
+
+    schema["$defs"]["Project"]["properties"]["description"] = {
+        "type": "object",
+        "properties": {
+            "lines": {"type": "array", "items": {"type": "integer"}, "minItems": 2, "maxItems": 2}
+        },
+        "required": ["lines"]
+    }
+    return schema
+
+
+def _index_lines(text: str) -> str:
+    """Prefix every line of text with its 1-based line number"""
+    return "\n".join(
+        f"[{number}] {line}" for number, line in enumerate(text.split("\n"), 1)
+    )
+
+
+def _segment_by_headings(text: str) -> Dict[str, str]:
+    """
+    Split line-numbered resume text into the part each decomposed section needs
+
+    Lines before the first recognised heading (name, contact details) go to
+    basic_info. A section with no matching heading gets the full text so
+    nothing is lost when a resume uses unusual headings.
+
+    Args:
+        text: Line-numbered resume text from _index_lines
+
+    Returns:
+        Dictionary mapping each SECTION_FIELDS key to its resume text
+    """
+    segments: Dict[str, List[str]] = {section: [] for section in SECTION_FIELDS}
+    current = "basic_info"
+    for line in text.split("\n"):
+        match = _HEADING_RE.match(line)
+        if match:
+            heading = " ".join(match.group(1).split()).upper()
+            current = _SECTION_HEADINGS.get(heading, current)
+        segments[current].append(line)
+
+    found_headings = any(segments[section] for section in SECTION_FIELDS if section != "basic_info")
+    return {
+        section: "\n".join(lines) if found_headings and lines else text
+        for section, lines in segments.items()
+    }
+
+
+def _resolve_line_pointers(llm_response: Dict[str, Any], lines: List[str]) -> None:
+    """Replace {"lines": [start, end]} project descriptions with the referenced resume text"""
+    for project in llm_response.get("projects") or []:
+        if not isinstance(project, dict):
+            continue
+        description = project.get("description")
+        if isinstance(description, dict):
+            pointer = description.get("lines")
+            if _is_line_range(pointer, len(lines)):
+                start, end = pointer
+                project["description"] = " ".join(
+                    line for line in lines[start - 1:min(end, len(lines))] if line
+                )
+            else:
+                # Malformed or out-of-range pointer: keep the project, drop the description
+                logger.warning("Ignoring invalid project line pointer: %r", pointer)
+                project["description"] = ""
+
+
+def _is_line_range(pointer: Any, line_count: int) -> bool:
+    """True for a [start, end] pair of 1-based line numbers starting within the resume"""
+    return (
+        isinstance(pointer, list)
+        and len(pointer) == 2
+        and all(isinstance(n, int) and not isinstance(n, bool) for n in pointer)
+        and 1 <= pointer[0] <= pointer[1]
+        and pointer[0] <= line_count
+    )
+
+
+@lru_cache(maxsize=None)
+def _read_prompt_template() -> Optional[str]:
+    """Read the resume parsing prompt from disk once per process, None if missing"""
+    prompt_path = Path(__file__).parent.parent.parent / "prompts" / "resume_parsing.txt"
+
+    try:
+        with open(prompt_path, 'r') as f:
+            template = f.read()
+        logger.debug("Loaded prompt template from %s", prompt_path)
+        return template
+    except FileNotFoundError:
+        logger.warning(f"Prompt template not found at {prompt_path}, using inline version")
+        return None
 
 
 class ResumeParser:
@@ -23,7 +205,10 @@ class ResumeParser:
     def __init__(
         self,
         llm_client: Optional[LLMClient] = None,
-        model: str = "gpt-4o-mini"  # Use mini for cost efficiency
+        model: str = "gpt-4o-mini",  # Use mini for cost efficiency
+        decomposed: bool = True,
+        cache_size: int = 128,
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize resume parser
@@ -31,6 +216,10 @@ class ResumeParser:
         Args:
             llm_client: Optional LLM client instance (creates default if not provided)
             model: Model to use for parsing (default: gpt-4o-mini for cost)
+            decomposed: Split parsing into parallel per-section LLM calls
+                (see SECTION_FIELDS) instead of one monolithic call
+            cache_size: Parsed resumes kept in memory, keyed by file content hash (0 disables)
+            cache_dir: Optional directory to also persist parsed resumes across processes
         """
         self.llm_client = llm_client or LLMClient(
             provider="openai",
@@ -39,23 +228,54 @@ class ResumeParser:
         )
         self.extractor = TextExtractor()
 
+        self.decomposed = decomposed
+
+        # Parsed resumes keyed by file content hash, stored as JSON
+        self.cache_size = cache_size
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
         # Load parsing prompt template
-        self.prompt_template = self._load_prompt_template()
+        self.prompt_template = self._load_prompt_template() + _LINE_POINTER_INSTRUCTION
+        self.section_templates = {
+            section: self.prompt_template + _SECTION_INSTRUCTION.format(fields=", ".join(fields))
+            for section, fields in SECTION_FIELDS.items()
+        }
+        self._prompt_prefix, self._prompt_suffix = _split_prompt_template(self.prompt_template)
+        self._section_prompt_parts = {
+            section: _split_prompt_template(template)
+            for section, template in self.section_templates.items()
+        }
 
         logger.info(f"ResumeParser initialized with model: {self.llm_client.model}")
 
+    # The template text never changes, so it is tokenized once and only the
+    # resume text is counted per parse
+    @cached_property
+    def _template_tokens(self) -> int:
+        """Token count of the monolithic prompt without the resume text"""
+        return (
+            self.llm_client.count_tokens(self._prompt_prefix)
+            + self.llm_client.count_tokens(self._prompt_suffix)
+        )
+
+    @cached_property
+    def _section_template_tokens(self) -> Dict[str, int]:
+        """Token count of each section prompt without the resume text"""
+        return {
+            section: self.llm_client.count_tokens(prefix) + self.llm_client.count_tokens(suffix)
+            for section, (prefix, suffix) in self._section_prompt_parts.items()
+        }
+
     def _load_prompt_template(self) -> str:
         """Load resume parsing prompt template from file"""
-        prompt_path = Path(__file__).parent.parent.parent / "prompts" / "resume_parsing.txt"
-
-        try:
-            with open(prompt_path, 'r') as f:
-                template = f.read()
-            logger.debug(f"Loaded prompt template from {prompt_path}")
-            return template
-        except FileNotFoundError:
-            logger.warning(f"Prompt template not found at {prompt_path}, using inline version")
+        template = _read_prompt_template()
+        if template is None:
             return self._get_inline_prompt_template()
+        return template
 
     def _get_inline_prompt_template(self) -> str:
         """Fallback inline prompt template if file not found"""
@@ -91,6 +311,14 @@ Return ONLY valid JSON, no additional text."""
         """
         logger.info(f"Parsing resume from file: {file_path}")
 
+        # Re-uploads of the same file skip extraction and the LLM entirely
+        cache_key = self._cache_key(file_path)
+        if cache_key:
+            cached_resume = self._get_cached(cache_key)
+            if cached_resume is not None:
+                logger.info(f"Using cached parse for: {file_path}")
+                return cached_resume
+
         # Step 1: Extract text from file
         try:
             resume_text = self.extractor.extract_text(file_path)
@@ -103,11 +331,77 @@ Return ONLY valid JSON, no additional text."""
         try:
             parsed_resume = self.parse_resume_from_text(resume_text)
             logger.info(f"Successfully parsed resume for: {parsed_resume.contact.name}")
-            return parsed_resume
         except Exception as e:
             logger.error(f"Resume parsing failed: {e}")
             raise
 
+        if cache_key:
+            self._store_cached(cache_key, parsed_resume)
+        return parsed_resume
+
+    def _cache_key(self, file_path: str) -> Optional[str]:
+        """
+        Build the cache key for a resume file from its content and parse settings
+
+        Args:
+            file_path: Path to resume file
+
+        Returns:
+            Cache key, or None if caching is disabled or the file cannot be read
+        """
+        if not self.cache_size and not self.cache_dir:
+            return None
+
+        # The model, the prompts and the decomposition mode all shape the parse,
+        # so they go into the key along with the file content
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(
+            [self.llm_client.model, self.decomposed, self.prompt_template]
+        ).encode('utf-8'))
+        try:
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+        except OSError:
+            # Let text extraction report the problem
+            return None
+
+        # Hex only, so the key is always a safe file name for cache_dir
+        return digest.hexdigest()
+
+    def _get_cached(self, cache_key: str) -> Optional[ParsedResume]:
+        """Return a cached ParsedResume for cache_key, if any"""
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+
+        if cached is None and self.cache_dir:
+            cache_file = self.cache_dir / f"{cache_key}.json"
+            if cache_file.exists():
+                cached = cache_file.read_text()
+
+        if cached is None:
+            return None
+
+        # Validate a fresh copy so callers cannot mutate the cached entry
+        return ParsedResume.model_validate_json(cached)
+
+    def _store_cached(self, cache_key: str, parsed_resume: ParsedResume) -> None:
+        """Store a parsed resume under cache_key"""
+        # Only fields that were set, so validators with defaults behave as on the first parse
+        cached = parsed_resume.model_dump_json(exclude_unset=True)
+
+        if self.cache_size:
+            with self._cache_lock:
+                self._cache[cache_key] = cached
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        if self.cache_dir:
+            (self.cache_dir / f"{cache_key}.json").write_text(cached)
+
     def parse_resume_from_text(self, resume_text: str) -> ParsedResume:
         """
         Parse resume from already-extracted text
@@ -126,10 +420,31 @@ Return ONLY valid JSON, no additional text."""
             >>> text = "John Doe\\njohn@example.com\\n..."
             >>> resume = parser.parse_resume_from_text(text)
         """
+        parsed_resume, _, _ = self._parse_text(resume_text)
+        return parsed_resume
+
+    def _parse_text(
+        self,
+        resume_text: str,
+        clean: bool = True
+    ) -> Tuple[ParsedResume, int, List[Dict[str, Any]]]:
+        """
+        Parse resume text, also returning the data needed for token accounting
+
+        Args:
+            resume_text: Raw text from resume
+            clean: Run clean_text first (text from TextExtractor.extract_text is already clean)
+
+        Returns:
+            Tuple of (parsed resume, prompt token count, JSON responses from each LLM call)
+
+        Raises:
+            ValueError: If parsing fails
+        """
         logger.info("Parsing resume text with LLM")
 
         # Clean text first
-        cleaned_text = self.extractor.clean_text(resume_text)
+        cleaned_text = self.extractor.clean_text(resume_text) if clean else resume_text
 
         if len(cleaned_text) < 100:
             raise ValueError(
@@ -137,41 +452,117 @@ Return ONLY valid JSON, no additional text."""
                 "Minimum 100 characters required."
             )
 
-        # Generate prompt
-        prompt = self.prompt_template.format(resume_text=cleaned_text)
-
-        # Count tokens for cost estimation
-        token_count = self.llm_client.count_tokens(prompt)
-        logger.info(f"Prompt token count: ~{token_count} tokens")
+        # Number the lines so long descriptions can be returned as line ranges
+        indexed_text = _index_lines(cleaned_text)
 
         # Call LLM to parse resume
         try:
             logger.debug("Calling LLM for resume parsing...")
-            response = self.llm_client.generate_json(
-                prompt=prompt,
-                max_tokens=4096  # Allow for detailed resumes
-            )
+            long_resume = len(cleaned_text) > LONG_RESUME_CHARS
+            if self.decomposed or long_resume:
+                response, token_count, raw_responses = self._generate_decomposed(
+                    indexed_text, segment=long_resume
+                )
+            else:
+                prompt = self._prompt_prefix + indexed_text + self._prompt_suffix
+
+                # Count tokens for cost estimation
+                token_count = self._template_tokens + self.llm_client.count_tokens(indexed_text)
+                logger.info(f"Prompt token count: ~{token_count} tokens")
+
+                response = self.llm_client.generate_json(
+                    prompt=prompt,
+                    max_tokens=4096,  # Allow for detailed resumes
+                    schema=_response_schema()
+                )
+                raw_responses = [response]
             logger.debug("LLM response received")
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"LLM API call failed: {e}")
             raise ValueError(f"Failed to call LLM for parsing: {e}")
 
         # Validate and convert to ParsedResume object
         try:
-            parsed_resume = self._validate_and_convert(response)
+            parsed_resume = self._validate_and_convert(response, cleaned_text.split("\n"))
             logger.info("Resume parsing successful")
-            return parsed_resume
+            return parsed_resume, token_count, raw_responses
         except Exception as e:
             logger.error(f"Failed to validate parsed resume: {e}")
-            logger.debug(f"LLM response: {json.dumps(response, indent=2)[:500]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("LLM response: %s...", json.dumps(response, indent=2)[:500])
             raise ValueError(f"Failed to validate parsed resume: {e}")
 
-    def _validate_and_convert(self, llm_response: Dict[Any, Any]) -> ParsedResume:
+    def _generate_decomposed(
+        self,
+        resume_text: str,
+        segment: bool = False
+    ) -> Tuple[Dict[str, Any], int, List[Dict[str, Any]]]:
+        """
+        Run one focused LLM call per resume section concurrently and merge the results
+
+        Args:
+            resume_text: Cleaned, line-numbered resume text
+            segment: Send each section only the resume text under its headings
+
+        Returns:
+            Tuple of (merged response covering every ParsedResume field,
+            total prompt token count, per-section responses)
+        """
+        if segment:
+            section_texts = _segment_by_headings(resume_text)
+        else:
+            section_texts = dict.fromkeys(SECTION_FIELDS, resume_text)
+
+        prompts = {
+            section: prefix + section_texts[section] + suffix
+            for section, (prefix, suffix) in self._section_prompt_parts.items()
+        }
+
+        # Sections sharing the same text are only tokenized once
+        text_tokens: Dict[str, int] = {}
+        for text in section_texts.values():
+            if text not in text_tokens:
+                text_tokens[text] = self.llm_client.count_tokens(text)
+        token_count = sum(self._section_template_tokens.values()) + sum(
+            text_tokens[text] for text in section_texts.values()
+        )
+        logger.info(f"Prompt token count: ~{token_count} tokens across {len(prompts)} sections")
+
+        with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+            futures = {
+                section: executor.submit(
+                    self.llm_client.generate_json,
+                    prompt=prompt,
+                    max_tokens=4096,
+                    schema=_response_schema(tuple(SECTION_FIELDS[section]))
+                )
+                for section, prompt in prompts.items()
+            }
+            section_responses = {section: future.result() for section, future in futures.items()}
+
+        # Keep only the fields each call was responsible for
+        merged: Dict[str, Any] = {}
+        for section, fields in SECTION_FIELDS.items():
+            section_response = section_responses[section]
+            for field in fields:
+                if field in section_response:
+                    merged[field] = section_response[field]
+
+        return merged, token_count, list(section_responses.values())
+
+    def _validate_and_convert(
+        self,
+        llm_response: Dict[Any, Any],
+        source_lines: Optional[List[str]] = None
+    ) -> ParsedResume:
         """
         Validate LLM response and convert to ParsedResume
 
         Args:
             llm_response: Raw JSON response from LLM
+            source_lines: Resume lines that line-range descriptions refer to
 
         Returns:
             Validated ParsedResume object
@@ -180,18 +571,30 @@ Return ONLY valid JSON, no additional text."""
             ValueError: If validation fails
         """
         try:
+            if source_lines is not None:
+                _resolve_line_pointers(llm_response, source_lines)
+
             # Pydantic will validate the data
             parsed_resume = ParsedResume(**llm_response)
 
             # Log parsed data summary
-            logger.info(f"Parsed resume summary:")
-            logger.info(f"  - Name: {parsed_resume.contact.name}")
-            logger.info(f"  - Email: {parsed_resume.contact.email}")
-            logger.info(f"  - Education entries: {len(parsed_resume.education)}")
-            logger.info(f"  - Experience entries: {len(parsed_resume.experience)}")
-            logger.info(f"  - Projects: {len(parsed_resume.projects)}")
-            logger.info(f"  - Total years experience: {parsed_resume.total_years_experience}")
-            logger.info(f"  - Experience level: {parsed_resume.experience_level}")
+            logger.info(
+                "Parsed resume summary:\n"
+                "  - Name: %s\n"
+                "  - Email: %s\n"
+                "  - Education entries: %d\n"
+                "  - Experience entries: %d\n"
+                "  - Projects: %d\n"
+                "  - Total years experience: %s\n"
+                "  - Experience level: %s",
+                parsed_resume.contact.name,
+                parsed_resume.contact.email,
+                len(parsed_resume.education),
+                len(parsed_resume.experience),
+                len(parsed_resume.projects),
+                parsed_resume.total_years_experience,
+                parsed_resume.experience_level,
+            )
 
             return parsed_resume
 
@@ -216,6 +619,90 @@ Return ONLY valid JSON, no additional text."""
         parsed_resume = self.parse_resume(file_path)
         return parsed_resume.model_dump()
 
+    def parse_resumes_batch(
+        self,
+        file_paths: List[str],
+        max_workers: int = 4,
+        max_concurrent: int = 4,
+        progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse many resumes, extracting text in processes and calling the LLM concurrently
+
+        A failure on one file does not stop the batch; it is reported in that
+        file's result instead.
+
+        Args:
+            file_paths: Paths to PDF or DOCX resume files
+            max_workers: Processes used for text extraction
+            max_concurrent: Maximum LLM requests in flight at once
+            progress_callback: Called as (completed, total, result) after each file finishes
+
+        Returns:
+            One result per input path, in input order, with 'path', 'status'
+            ('success' or 'error') and either 'resume' or 'error' keys
+
+        Examples:
+            >>> parser = ResumeParser()
+            >>> results = parser.parse_resumes_batch(["a.pdf", "b.docx"])
+            >>> print([r['status'] for r in results])
+        """
+        total = len(file_paths)
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        completed = 0
+
+        def record(index: int, result: Dict[str, Any]) -> None:
+            nonlocal completed
+            results[index] = result
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, result)
+
+        def record_error(index: int, error: Exception) -> None:
+            logger.error(f"Failed to parse resume {file_paths[index]}: {error}")
+            record(index, {'path': file_paths[index], 'status': 'error', 'error': str(error)})
+
+        logger.info(f"Parsing batch of {total} resumes")
+
+        # Stage 1: text extraction is CPU-bound, run it in worker processes
+        texts: Dict[int, str] = {}
+        if file_paths:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(TextExtractor.extract_text, path): index
+                    for index, path in enumerate(file_paths)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        texts[index] = future.result()
+                    except Exception as e:
+                        record_error(index, e)
+
+        # Stage 2: LLM parsing is network-bound, overlap the requests in threads
+        if texts:
+            with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+                futures = {
+                    executor.submit(self.parse_resume_from_text, text): index
+                    for index, text in texts.items()
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        parsed_resume = future.result()
+                    except Exception as e:
+                        record_error(index, e)
+                        continue
+                    record(index, {
+                        'path': file_paths[index],
+                        'status': 'success',
+                        'resume': parsed_resume
+                    })
+
+        succeeded = sum(1 for result in results if result['status'] == 'success')
+        logger.info(f"Batch parsing complete: {succeeded}/{total} succeeded")
+        return results
+
     def get_parsing_stats(self, file_path: str) -> Dict[str, Any]:
         """
         Parse resume and return both data and statistics
@@ -231,17 +718,17 @@ Return ONLY valid JSON, no additional text."""
             >>> result = parser.get_parsing_stats("resume.pdf")
             >>> print(result['stats']['tokens_used'])
         """
-        # Extract text
+        # Extract text (already cleaned by extract_text)
         resume_text = self.extractor.extract_text(file_path)
         text_stats = self.extractor.get_text_stats(resume_text)
 
-        # Parse resume
-        parsed_resume = self.parse_resume_from_text(resume_text)
+        # Parse resume, reusing the prompt token count from the parse itself
+        parsed_resume, input_tokens, raw_responses = self._parse_text(resume_text, clean=False)
 
-        # Calculate token usage
-        prompt = self.prompt_template.format(resume_text=resume_text)
-        input_tokens = self.llm_client.count_tokens(prompt)
-        output_tokens = self.llm_client.count_tokens(json.dumps(parsed_resume.model_dump()))
+        # Output tokens are counted on what the LLM returned, not the validated model
+        output_tokens = sum(
+            self.llm_client.count_tokens(json.dumps(response)) for response in raw_responses
+        )
 
         stats = {
             'text_stats': text_stats,
@@ -305,5 +792,10 @@ def parse_resume(file_path: str, model: str = "gpt-4o-mini") -> ParsedResume:
         >>> resume = parse_resume("resume.pdf")
         >>> print(resume.contact.name)
     """
-    parser = ResumeParser(model=model)
-    return parser.parse_resume(file_path)
+    return _get_parser(model).parse_resume(file_path)
+
+
+@lru_cache(maxsize=4)
+def _get_parser(model: str) -> ResumeParser:
+    """Shared ResumeParser per model, so repeated parse_resume calls reuse its client and cache"""
+    return ResumeParser(model=model)
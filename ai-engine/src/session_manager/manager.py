@@ -4,10 +4,10 @@ Manages interview sessions and user progress tracking
 """
 
 from typing import List, Dict, Optional, Any, Tuple
+from collections import Counter
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
-import statistics
 
 from src.session_manager.schemas import (
     InterviewSession,
@@ -30,18 +30,25 @@ from src.evaluator.schemas import EvaluationRequest
 class SessionManager:
     """Manages interview sessions and progress"""
     
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        data_dir: Optional[Path] = None,
+        question_generator: Optional[QuestionGenerator] = None,
+        answer_evaluator: Optional[AnswerEvaluator] = None
+    ):
         """
         Initialize session manager
         
         Args:
             data_dir: Directory to store session data
+            question_generator: Question generator to reuse (creates default if not provided)
+            answer_evaluator: Answer evaluator to reuse (creates default if not provided)
         """
         self.data_dir = data_dir or Path("data/sessions")
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
-        self.question_generator = QuestionGenerator()
-        self.answer_evaluator = AnswerEvaluator()
+        self.question_generator = question_generator or QuestionGenerator()
+        self.answer_evaluator = answer_evaluator or AnswerEvaluator()
         
         # In-memory cache
         self._sessions: Dict[str, InterviewSession] = {}
@@ -404,10 +411,15 @@ class SessionManager:
         # Calculate metrics
         scores = [s.average_score for s in completed_sessions if s.average_score]
         if scores:
+            # NumPy reductions avoid the exact (Fraction-based) arithmetic in statistics.
+            # Imported here so importing the session manager doesn't pay for NumPy
+            import numpy as np
+
+            score_array = np.asarray(scores, dtype=np.float64)
             analytics.average_score = sum(scores) / len(scores)
-            analytics.median_score = statistics.median(scores)
+            analytics.median_score = float(np.median(score_array))
             if len(scores) > 1:
-                analytics.score_variance = statistics.variance(scores)
+                analytics.score_variance = float(score_array.var(ddof=1))
         
         # Session breakdown
         analytics.sessions_by_type = {}
@@ -633,15 +645,33 @@ class SessionManager:
         if not completed:
             return progress
         
-        # Calculate statistics
-        progress.total_questions_answered = sum(s.questions_answered for s in completed)
+        # Aggregate every completed session in a single pass
+        scores = []
+        total_duration = 0
+        tech_total, tech_count = 0.0, 0
+        beh_total, beh_count = 0.0, 0
+        strength_counter = Counter()
+        weakness_counter = Counter()
         
-        durations = [s.total_duration_seconds for s in completed if s.total_duration_seconds]
-        if durations:
-            progress.total_time_spent_hours = sum(durations) / 3600
+        for session in completed:
+            progress.total_questions_answered += session.questions_answered
+            if session.total_duration_seconds:
+                total_duration += session.total_duration_seconds
+            if session.average_score:
+                scores.append(session.average_score)
+            if session.technical_score:
+                tech_total += session.technical_score
+                tech_count += 1
+            if session.behavioral_score:
+                beh_total += session.behavioral_score
+                beh_count += 1
+            strength_counter.update(session.strengths)
+            weakness_counter.update(session.weaknesses)
+        
+        if total_duration:
+            progress.total_time_spent_hours = total_duration / 3600
         
         # Score statistics
-        scores = [s.average_score for s in completed if s.average_score]
         if scores:
             progress.average_score = sum(scores) / len(scores)
             progress.best_score = max(scores)
@@ -649,13 +679,10 @@ class SessionManager:
             progress.score_trend = scores[-10:]  # Last 10 sessions
         
         # Technical vs behavioral
-        tech_scores = [s.technical_score for s in completed if s.technical_score]
-        beh_scores = [s.behavioral_score for s in completed if s.behavioral_score]
-        
-        if tech_scores:
-            progress.technical_average = sum(tech_scores) / len(tech_scores)
-        if beh_scores:
-            progress.behavioral_average = sum(beh_scores) / len(beh_scores)
+        if tech_count:
+            progress.technical_average = tech_total / tech_count
+        if beh_count:
+            progress.behavioral_average = beh_total / beh_count
         
         # Improvement rate
         if len(scores) >= 2:
@@ -668,19 +695,7 @@ class SessionManager:
             if avg_first > 0:
                 progress.improvement_rate = ((avg_second - avg_first) / avg_first) * 100
         
-        # Aggregate strengths and weaknesses
-        all_strengths = []
-        all_weaknesses = []
-        
-        for session in completed:
-            all_strengths.extend(session.strengths)
-            all_weaknesses.extend(session.weaknesses)
-        
-        # Get top 5 most common
-        from collections import Counter
-        strength_counter = Counter(all_strengths)
-        weakness_counter = Counter(all_weaknesses)
-        
+        # Get top 5 most common strengths and weaknesses
         progress.top_strengths = [s for s, _ in strength_counter.most_common(5)]
         progress.top_weaknesses = [w for w, _ in weakness_counter.most_common(5)]
         
@@ -699,9 +714,7 @@ class SessionManager:
         if not session.user_id:
             return
         
-        progress = self.get_user_progress(session.user_id)
-        
-        # Recalculate from all sessions
+        # Recalculate from all sessions (the cached progress is replaced, so it is not loaded first)
         sessions = self.get_user_sessions(session.user_id, limit=1000)
         updated_progress = self._calculate_user_progress(session.user_id, sessions)
         
@@ -753,8 +766,7 @@ class SessionManager:
     def _save_session(self, session: InterviewSession) -> None:
         """Save session to disk"""
         session_file = self.data_dir / f"session_{session.session_id}.json"
-        with open(session_file, 'w') as f:
-            json.dump(session.model_dump(), f, indent=2)
+        session_file.write_text(session.model_dump_json(indent=2), encoding="utf-8")
     
     def _load_session(self, session_id: str) -> InterviewSession:
         """Load session from disk"""
@@ -763,16 +775,12 @@ class SessionManager:
         if not session_file.exists():
             raise ValueError(f"Session {session_id} not found")
         
-        with open(session_file, 'r') as f:
-            data = json.load(f)
-        
-        return InterviewSession(**data)
+        return InterviewSession.from_json(session_file.read_bytes())
     
     def _save_user_progress(self, progress: UserProgress) -> None:
         """Save user progress to disk"""
         progress_file = self.data_dir / f"progress_{progress.user_id}.json"
-        with open(progress_file, 'w') as f:
-            json.dump(progress.model_dump(), f, indent=2)
+        progress_file.write_text(progress.model_dump_json(indent=2), encoding="utf-8")
     
     def get_milestones(self, user_id: str) -> List[Milestone]:
         """Get user's milestones"""
@@ -4,7 +4,7 @@ Pydantic models for interview sessions and progress tracking
 """
 
 from pydantic import BaseModel, Field, ConfigDict, field_validator
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, Literal, Union
 from enum import Enum
 from datetime import datetime
 import uuid
@@ -36,9 +36,18 @@ class SessionType(str, Enum):
     CODING = "coding"
 
 
+# Values of question_generator's QuestionType, kept as plain strings on responses
+QuestionTypeLiteral = Literal["technical", "behavioral", "situational", "system_design", "coding"]
+
+# Question types counted towards technical_score / behavioral_score
+_TECHNICAL_TYPES = frozenset({"technical", "coding", "system_design"})
+_BEHAVIORAL_TYPES = frozenset({"behavioral", "situational"})
+
+
 class QuestionResponse(BaseModel):
     """Single question response in a session"""
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "question_id": "q_123",
@@ -53,7 +62,7 @@ class QuestionResponse(BaseModel):
     
     question_id: str = Field(..., description="Question identifier")
     question_text: str = Field(..., description="The question asked")
-    question_type: str = Field(..., description="Type of question")
+    question_type: QuestionTypeLiteral = Field(..., description="Type of question")
     question_difficulty: str = Field(default="medium")
     
     answer_text: Optional[str] = Field(None, description="Candidate's answer")
@@ -73,6 +82,7 @@ class QuestionResponse(BaseModel):
 class InterviewSession(BaseModel):
     """Complete interview session"""
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "session_id": "sess_abc123",
@@ -133,8 +143,19 @@ class InterviewSession(BaseModel):
     resume_id: Optional[str] = None
     resume_summary: Optional[Dict[str, Any]] = None
     
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "InterviewSession":
+        """Load a session from its JSON form in a single validation pass"""
+        return cls.model_validate_json(raw)
+    
     def add_response(self, response: QuestionResponse) -> None:
-        """Add a question response to the session"""
+        """
+        Add a question response to the session
+        
+        The response is appended as-is and the session is not re-validated,
+        so pass a QuestionResponse that was built (and validated) by the caller.
+        To copy a session without re-validating it, use model_copy().
+        """
         self.responses.append(response)
         if not response.is_skipped:
             self.questions_answered += 1
@@ -145,25 +166,37 @@ class InterviewSession(BaseModel):
     
     def calculate_metrics(self) -> None:
         """Calculate session performance metrics"""
-        answered_responses = [r for r in self.responses if not r.is_skipped and r.evaluation_score is not None]
+        # Single pass over responses, accumulating time and each category's score sum and count
+        total_time = 0
+        score_total, score_count = 0.0, 0
+        technical_total, technical_count = 0.0, 0
+        behavioral_total, behavioral_count = 0.0, 0
+        
+        for r in self.responses:
+            total_time += r.time_spent_seconds
+            if r.is_skipped or r.evaluation_score is None:
+                continue
+            score_total += r.evaluation_score
+            score_count += 1
+            if r.question_type in _TECHNICAL_TYPES:
+                technical_total += r.evaluation_score
+                technical_count += 1
+            elif r.question_type in _BEHAVIORAL_TYPES:
+                behavioral_total += r.evaluation_score
+                behavioral_count += 1
         
-        if answered_responses:
-            scores = [r.evaluation_score for r in answered_responses]
-            self.average_score = sum(scores) / len(scores)
+        if score_count:
+            self.average_score = score_total / score_count
             
             # Calculate technical vs behavioral scores
-            technical_responses = [r for r in answered_responses if r.question_type in ["technical", "coding", "system_design"]]
-            behavioral_responses = [r for r in answered_responses if r.question_type in ["behavioral", "situational"]]
-            
-            if technical_responses:
-                self.technical_score = sum(r.evaluation_score for r in technical_responses) / len(technical_responses)
+            if technical_count:
+                self.technical_score = technical_total / technical_count
             
-            if behavioral_responses:
-                self.behavioral_score = sum(r.evaluation_score for r in behavioral_responses) / len(behavioral_responses)
+            if behavioral_count:
+                self.behavioral_score = behavioral_total / behavioral_count
             
             # Calculate total duration
-            time_spent = [r.time_spent_seconds for r in self.responses]
-            self.total_duration_seconds = sum(time_spent)
+            self.total_duration_seconds = total_time
         
         self.updated_at = datetime.now().isoformat()
     
@@ -181,6 +214,7 @@ class InterviewSession(BaseModel):
 class SessionCreateRequest(BaseModel):
     """Request to create a new interview session"""
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "candidate_name": "John Doe",
@@ -218,6 +252,7 @@ class SessionCreateRequest(BaseModel):
 class UserProgress(BaseModel):
     """User's progress tracking across sessions"""
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "user_id": "user_123",
@@ -269,6 +304,7 @@ class UserProgress(BaseModel):
 class ProgressAnalytics(BaseModel):
     """Detailed analytics for user progress"""
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "user_id": "user_123",
@@ -318,6 +354,7 @@ class ProgressAnalytics(BaseModel):
 class SessionComparison(BaseModel):
     """Comparison between multiple sessions"""
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "session_ids": ["sess_1", "sess_2"],
@@ -355,6 +392,7 @@ class SessionComparison(BaseModel):
 class Milestone(BaseModel):
     """Achievement milestone"""
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "milestone_id": "milestone_first_100",
@@ -383,6 +421,7 @@ class Milestone(BaseModel):
 class LearningPath(BaseModel):
     """Personalized learning path recommendation"""
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "user_id": "user_123",
@@ -3,16 +3,171 @@ LLM Client Wrapper
 Unified interface for OpenAI and Anthropic APIs with retry logic
 """
 
-from openai import OpenAI
-from anthropic import Anthropic
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+import asyncio
 import json
-from typing import Optional, Dict, Any
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Optional, Dict, Any, Callable, Iterator, List, Type, TypeVar, Union, TYPE_CHECKING
 import os
+import sys
+import weakref
 from dotenv import load_dotenv
+from pydantic import BaseModel
+from src.utils.response_cache import (
+    cache_response,
+    get_cached_response,
+    response_cache_enabled,
+    response_cache_key,
+)
+from src.utils.rate_limiter import RateLimiter
+
+# The provider SDKs take around a second each to import, so only the one a
+# client is created for gets loaded (see _get_sdk_client and LLMClient.aclient)
+if TYPE_CHECKING:
+    from anthropic import Anthropic, AsyncAnthropic
+    from openai import AsyncOpenAI, OpenAI
 
-# Load environment variables
-load_dotenv()
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+try:
+    import orjson  # Optional: pip install "ai-engine[fast-json]"
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either the same way
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Markdown code fences around a JSON response
+_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$', re.DOTALL)
+# JSON string literals (matched whole, so braces inside them are skipped) and braces
+_JSON_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]')
+
+# OpenAI models that accept response_format={"type": "json_object"}
+_JSON_MODE_MODELS = frozenset({"gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-4o-mini", "gpt-4-mini"})
+# OpenAI models that accept response_format={"type": "json_schema", ...}
+_STRUCTURED_OUTPUT_MODELS = frozenset({"gpt-4o", "gpt-4o-mini"})
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(provider: str, model: str):
+    """Load the tiktoken encoding for a model once and reuse it"""
+    if provider == "openai":
+        return tiktoken.encoding_for_model(model)
+    # Use cl100k_base for Claude (approximation)
+    return tiktoken.get_encoding("cl100k_base")
+
+
+# Texts longer than this (resumes, full prompts) are rarely repeated verbatim,
+# so they are counted directly rather than kept alive in the token-count cache
+_TOKEN_CACHE_MAX_CHARS = 8192
+
+
+@lru_cache(maxsize=1024)
+def _count_tokens(text: str, provider: str, model: str) -> int:
+    """Token count memoized per text, since system prompts and templates repeat"""
+    return len(_get_encoding(provider, model).encode(text))
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load .env into the environment once per process, when the first client is created"""
+    load_dotenv()
+
+
+@lru_cache(maxsize=None)
+def _get_sdk_client(provider: str, api_key: Optional[str]) -> Union["OpenAI", "Anthropic"]:
+    """
+    One sync SDK client per provider and API key, shared by every LLMClient
+
+    Each SDK client keeps its own keep-alive connection pool, so sharing it lets
+    the parser, generator and evaluator reuse connections instead of each
+    opening (and TLS-handshaking) their own.
+    """
+    if provider == "openai":
+        from openai import OpenAI
+
+        return OpenAI(api_key=api_key)
+
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=api_key)
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """
+    True for provider errors worth retrying (rate limits, timeouts, connection and 5xx errors)
+
+    Authentication, permission and bad-request errors fail straight away. The SDK
+    modules are looked up in sys.modules, since an error from an SDK means it is loaded.
+    """
+    for module_name in ("openai", "anthropic"):
+        sdk = sys.modules.get(module_name)
+        if sdk is not None and isinstance(exc, (
+            sdk.RateLimitError,
+            sdk.APIConnectionError,  # Includes APITimeoutError
+            sdk.InternalServerError,
+        )):
+            return True
+    return False
+
+
+_retry_transient_errors = retry(
+    retry=retry_if_exception(_is_transient_error),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=1, max=10)
+)
+
+
+def _strip_code_fences(response: str) -> str:
+    """Remove markdown code blocks wrapped around a JSON response"""
+    return _FENCE_RE.sub('', response.strip()).strip()
+
+
+def _extract_json_object(s: str) -> Optional[str]:
+    """
+    Return the first complete {...} object in s, or None
+
+    Scans once from the first "{", counting brace depth and skipping string
+    literals, so prose after the object or a second JSON snippet is left out.
+    """
+    start = s.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    for match in _JSON_TOKEN_RE.finditer(s, start):
+        token = match.group()
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                return s[start:match.end()]
+    return None
+
+
+def _parse_json_response(response: str) -> Dict[Any, Any]:
+    """Parse a JSON response, falling back to the first {...} object in the text"""
+    response = _strip_code_fences(response)
+
+    try:
+        return _json_loads(response)
+    except json.JSONDecodeError as e:
+        # Try to extract JSON from response
+        json_object = _extract_json_object(response)
+        if json_object is not None:
+            try:
+                return _json_loads(json_object)
+            except json.JSONDecodeError:
+                pass
+        raise ValueError(f"Failed to parse JSON response: {e}\nResponse: {response[:500]}")
 
 
 class LLMClient:
@@ -24,7 +179,8 @@ class LLMClient:
         model: Optional[str] = None,
         temperature: float = 0.0,
         api_key: Optional[str] = None,
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        rate_limiter: Optional[RateLimiter] = None
     ):
         """
         Initialize LLM client
@@ -35,21 +191,26 @@ class LLMClient:
             temperature: Temperature for generation (0.0 = deterministic)
             api_key: API key (defaults to env var)
             max_tokens: Maximum tokens in response
+            rate_limiter: Budget every provider request waits on, shareable
+                between clients (optional)
         """
+        _load_env()
+
         self.provider = provider.lower()
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.rate_limiter = rate_limiter
 
         if self.provider == "openai":
-            self.client = OpenAI(
-                api_key=api_key or os.getenv("OPENAI_API_KEY")
+            self.client = _get_sdk_client(
+                self.provider, api_key or os.getenv("OPENAI_API_KEY")
             )
             # Changed from gpt-4 to gpt-4o-mini for 50-70% faster response times
             self.model = model or os.getenv("DEFAULT_MODEL", "gpt-4o-mini")
 
         elif self.provider == "anthropic":
-            self.client = Anthropic(
-                api_key=api_key or os.getenv("ANTHROPIC_API_KEY")
+            self.client = _get_sdk_client(
+                self.provider, api_key or os.getenv("ANTHROPIC_API_KEY")
             )
             self.model = model or "claude-3-5-sonnet-20241022"
 
@@ -58,41 +219,93 @@ class LLMClient:
                 f"Unsupported provider: {provider}. Choose 'openai' or 'anthropic'"
             )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
+        # Response format support is fixed per model, so resolve it once
+        self._supports_json_mode = self.model in _JSON_MODE_MODELS
+        self._supports_structured_outputs = self.model in _STRUCTURED_OUTPUT_MODELS
+        # Async SDK clients by event loop; see aclient
+        self._aclients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @_retry_transient_errors
     def generate(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         json_mode: bool = False,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        json_schema: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Generate response from LLM
 
+        With PREPWISE_CACHE=1, identical requests at temperature 0 are answered
+        from an on-disk cache (see src.utils.response_cache) instead of calling
+        the provider; sampled requests always reach it.
+
         Args:
             prompt: User prompt
             system_prompt: System prompt (optional)
             json_mode: Enable JSON response format
             temperature: Override default temperature
             max_tokens: Override default max tokens
+            json_schema: JSON schema the response must follow (OpenAI structured outputs)
 
         Returns:
             Generated text response
 
         Raises:
+            RateLimitExceeded: If the rate limiter's wait would be too long
             Exception: If API call fails after retries
         """
         temp = temperature if temperature is not None else self.temperature
         tokens = max_tokens if max_tokens is not None else self.max_tokens
 
+        cache_key = self._cache_key(prompt, system_prompt, json_mode, temp, tokens, json_schema)
+        if cache_key is not None:
+            cached = get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
         if self.provider == "openai":
-            return self._generate_openai(prompt, system_prompt, json_mode, temp, tokens)
-        elif self.provider == "anthropic":
-            return self._generate_anthropic(prompt, system_prompt, temp, tokens)
+            response = self._generate_openai(
+                prompt, system_prompt, json_mode, temp, tokens, json_schema
+            )
+        else:
+            response = self._generate_anthropic(prompt, system_prompt, temp, tokens)
+
+        if cache_key is not None:
+            cache_response(cache_key, response)
+        return response
+
+    def _cache_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        json_mode: bool,
+        temperature: float,
+        max_tokens: int,
+        json_schema: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """
+        Response cache key for a request
+
+        Only deterministic (temperature 0) requests are cached: replaying one
+        sample of a sampled request would pin every later call to it.
+
+        Returns:
+            The key, or None when PREPWISE_CACHE is off or temperature isn't 0
+        """
+        if temperature != 0 or not response_cache_enabled():
+            return None
+        return response_cache_key(
+            self.provider, self.model, prompt, system_prompt,
+            json_mode, temperature, max_tokens, json_schema
+        )
 
     def _generate_openai(
         self,
@@ -100,15 +313,30 @@ class LLMClient:
         system_prompt: Optional[str],
         json_mode: bool,
         temperature: float,
-        max_tokens: int
+        max_tokens: int,
+        json_schema: Optional[Dict[str, Any]] = None
     ) -> str:
         """Generate response using OpenAI API"""
-        messages = []
+        response = self.client.chat.completions.create(**self._openai_request(
+            prompt, system_prompt, json_mode, temperature, max_tokens, json_schema
+        ))
+        return response.choices[0].message.content
 
+    def _openai_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        json_mode: bool,
+        temperature: float,
+        max_tokens: int,
+        json_schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build chat.completions.create arguments, shared by the sync and async clients"""
+        user_message = {"role": "user", "content": prompt}
         if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-
-        messages.append({"role": "user", "content": prompt})
+            messages = [{"role": "system", "content": system_prompt}, user_message]
+        else:
+            messages = [user_message]
 
         kwargs = {
             "model": self.model,
@@ -117,15 +345,20 @@ class LLMClient:
             "max_tokens": max_tokens
         }
 
+        # Constrain decoding to the schema where structured outputs are available
+        if json_schema and self._supports_structured_outputs:
+            kwargs["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": "response", "schema": json_schema}
+            }
         # Enable JSON mode if requested (only for certain models)
-        if json_mode and self.model in ["gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-4o-mini", "gpt-4-mini"]:
+        elif json_mode and self._supports_json_mode:
             kwargs["response_format"] = {"type": "json_object"}
             # Ensure prompt asks for JSON
             if "json" not in prompt.lower():
-                messages[-1]["content"] += "\n\nReturn your response as valid JSON."
+                user_message["content"] += "\n\nReturn your response as valid JSON."
 
-        response = self.client.chat.completions.create(**kwargs)
-        return response.choices[0].message.content
+        return kwargs
 
     def _generate_anthropic(
         self,
@@ -136,20 +369,230 @@ class LLMClient:
     ) -> str:
         """Generate response using Anthropic API"""
         response = self.client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            system=system_prompt or "",
-            messages=[{"role": "user", "content": prompt}]
+            **self._anthropic_request(prompt, system_prompt, temperature, max_tokens)
         )
         return response.content[0].text
 
-    def generate_json(
+    def _anthropic_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """Build messages.create arguments, shared by the sync and async clients"""
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system_prompt or "",
+            "messages": [{"role": "user", "content": prompt}]
+        }
+
+    def generate_stream(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Stream a response from the LLM as text chunks arrive
+
+        Use this where time to first token matters (e.g. showing feedback to a
+        candidate); generate() is still the call for complete responses.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt (optional)
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+
+        Yields:
+            Text chunks in the order the model produces them
+
+        Examples:
+            >>> for chunk in client.generate_stream("Explain hash tables"):
+            ...     print(chunk, end="", flush=True)
+        """
+        temp = temperature if temperature is not None else self.temperature
+        tokens = max_tokens if max_tokens is not None else self.max_tokens
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        if self.provider == "openai":
+            stream = self.client.chat.completions.create(
+                stream=True,
+                **self._openai_request(prompt, system_prompt, False, temp, tokens)
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+            return
+
+        with self.client.messages.stream(
+            **self._anthropic_request(prompt, system_prompt, temp, tokens)
+        ) as stream:
+            yield from stream.text_stream
+
+    @property
+    def aclient(self) -> Union["AsyncOpenAI", "AsyncAnthropic"]:
+        """
+        Async SDK client for the running event loop
+
+        Created on first async call with the sync client's API key. Async
+        connections belong to the loop that opened them, so each event loop
+        (a server's, or one started by asyncio.run() in a worker thread) gets its own.
+        """
+        loop = asyncio.get_running_loop()
+        aclient = self._aclients.get(loop)
+        if aclient is None:
+            if self.provider == "openai":
+                from openai import AsyncOpenAI
+
+                aclient = AsyncOpenAI(api_key=self.client.api_key)
+            else:
+                from anthropic import AsyncAnthropic
+
+                aclient = AsyncAnthropic(api_key=self.client.api_key)
+            self._aclients[loop] = aclient
+        return aclient
+
+    @_retry_transient_errors
+    async def generate_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        json_mode: bool = False,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        json_schema: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate response from LLM without blocking the event loop
+
+        Takes the same arguments as generate(). Run several prompts concurrently
+        with asyncio.gather(*(client.generate_async(p) for p in prompts)).
+
+        Returns:
+            Generated text response
+
+        Raises:
+            RateLimitExceeded: If the rate limiter's wait would be too long
+            Exception: If API call fails after retries
+        """
+        temp = temperature if temperature is not None else self.temperature
+        tokens = max_tokens if max_tokens is not None else self.max_tokens
+
+        cache_key = self._cache_key(prompt, system_prompt, json_mode, temp, tokens, json_schema)
+        if cache_key is not None:
+            cached = get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+
+        if self.provider == "openai":
+            response = await self.aclient.chat.completions.create(**self._openai_request(
+                prompt, system_prompt, json_mode, temp, tokens, json_schema
+            ))
+            text = response.choices[0].message.content
+        else:
+            response = await self.aclient.messages.create(
+                **self._anthropic_request(prompt, system_prompt, temp, tokens)
+            )
+            text = response.content[0].text
+
+        if cache_key is not None:
+            cache_response(cache_key, text)
+        return text
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        json_mode: bool = False,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        return_exceptions: bool = False,
+        max_concurrent: int = 4,
+        overrides: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Any]:
+        """
+        Generate responses for several prompts concurrently
+
+        Each prompt is sent through generate() on a worker thread, sharing the
+        pooled sync client, so the batch takes about as long as its slowest
+        prompt rather than the sum of them. Safe to call with or without a
+        running event loop; async code can also gather generate_async() instead.
+
+        Args:
+            prompts: User prompts
+            system_prompt: System prompt shared by every prompt (optional)
+            json_mode: Enable JSON response format
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            return_exceptions: Put a failed prompt's exception in its slot instead of raising it
+            max_concurrent: Maximum LLM requests in flight at once, to stay under rate limits
+            overrides: Per-prompt generate() arguments, e.g. {"temperature": 0.7},
+                taking precedence over the shared ones (optional)
+
+        Returns:
+            Generated text responses, in the same order as prompts
+
+        Raises:
+            Exception: If an API call fails after retries and return_exceptions is False
+        """
+        shared = {
+            "system_prompt": system_prompt,
+            "json_mode": json_mode,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+        return self._run_batch(
+            [
+                partial(self.generate, prompt=prompt, **{**shared, **(extra or {})})
+                for prompt, extra in zip(prompts, overrides or [None] * len(prompts))
+            ],
+            return_exceptions,
+            max_concurrent
+        )
+
+    def _run_batch(
+        self,
+        calls: List[Callable[[], Any]],
+        return_exceptions: bool,
+        max_concurrent: int
+    ) -> List[Any]:
+        """Run calls on worker threads, at most max_concurrent at a time, returning results in order"""
+        if not calls:
+            return []
+
+        executor = ThreadPoolExecutor(max_workers=min(max_concurrent, len(calls)))
+        futures = [executor.submit(call) for call in calls]
+        results = []
+        try:
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+        finally:
+            # After a failure (without return_exceptions), drop the requests still queued
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def generate_json(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        schema: Optional[Dict[str, Any]] = None
     ) -> Dict[Any, Any]:
         """
         Generate and parse JSON response
@@ -159,6 +602,7 @@ class LLMClient:
             system_prompt: System prompt (optional)
             temperature: Override default temperature
             max_tokens: Override default max tokens
+            schema: JSON schema for the response, e.g. Model.model_json_schema()
 
         Returns:
             Parsed JSON dictionary
@@ -175,31 +619,133 @@ class LLMClient:
             system_prompt=system_prompt,
             json_mode=True,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            json_schema=schema
         )
 
-        # Clean response (remove markdown code blocks if present)
-        response = response.strip()
-        if response.startswith("```json"):
-            response = response[7:]
-        if response.startswith("```"):
-            response = response[3:]
-        if response.endswith("```"):
-            response = response[:-3]
-        response = response.strip()
+        return _parse_json_response(response)
+
+    async def generate_json_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[Any, Any]:
+        """
+        Async variant of generate_json(), taking the same arguments
+
+        Returns:
+            Parsed JSON dictionary
 
+        Raises:
+            ValueError: If response is not valid JSON
+        """
+        if "json" not in prompt.lower():
+            prompt += "\n\nReturn ONLY valid JSON, no additional text."
+
+        response = await self.generate_async(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            json_mode=True,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            json_schema=schema
+        )
+
+        return _parse_json_response(response)
+
+    def generate_json_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        return_exceptions: bool = False,
+        max_concurrent: int = 4
+    ) -> List[Any]:
+        """
+        generate_json() for several prompts at once, sent concurrently like generate_batch()
+
+        Returns:
+            Parsed JSON dictionaries, in the same order as prompts
+
+        Raises:
+            ValueError: If a response is not valid JSON and return_exceptions is False
+        """
+        return self._run_batch(
+            [
+                partial(
+                    self.generate_json,
+                    prompt=prompt,
+                    system_prompt=system_prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    schema=schema
+                )
+                for prompt in prompts
+            ],
+            return_exceptions,
+            max_concurrent
+        )
+
+    def generate_model(
+        self,
+        prompt: str,
+        schema: Type[ModelT],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> ModelT:
+        """
+        Generate a JSON response and validate it straight into a Pydantic model
+
+        Args:
+            prompt: User prompt (should request JSON output)
+            schema: Pydantic model class the response must match
+            system_prompt: System prompt (optional)
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+
+        Returns:
+            Validated schema instance
+
+        Raises:
+            pydantic.ValidationError: If the response does not match the schema
+        """
+        if "json" not in prompt.lower():
+            prompt += "\n\nReturn ONLY valid JSON, no additional text."
+
+        response = self.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            json_mode=True,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            json_schema=schema.model_json_schema()
+        )
+
+        # Validate the raw text in one pass instead of json.loads + model_validate
+        return schema.model_validate_json(_strip_code_fences(response))
+
+    def warm_up(self) -> bool:
+        """
+        Open a connection to the provider ahead of the first real request
+
+        Lists the available models, which costs no tokens. The TLS
+        handshake is then already done and pooled when the first
+        generation call arrives. Best effort: failures are swallowed.
+
+        Returns:
+            True if the provider answered, False otherwise
+        """
         try:
-            return json.loads(response)
-        except json.JSONDecodeError as e:
-            # Try to extract JSON from response
-            import re
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                try:
-                    return json.loads(json_match.group())
-                except:
-                    pass
-            raise ValueError(f"Failed to parse JSON response: {e}\nResponse: {response[:500]}")
+            self.client.models.list()
+            return True
+        except Exception:
+            return False
 
     def count_tokens(self, text: str) -> int:
         """
@@ -211,17 +757,12 @@ class LLMClient:
         Returns:
             Approximate token count
         """
-        try:
-            import tiktoken
-            if self.provider == "openai":
-                encoding = tiktoken.encoding_for_model(self.model)
-            else:
-                # Use cl100k_base for Claude (approximation)
-                encoding = tiktoken.get_encoding("cl100k_base")
-            return len(encoding.encode(text))
-        except ImportError:
+        if tiktoken is None:
             # Rough approximation: 1 token H 4 characters
             return len(text) // 4
+        if len(text) > _TOKEN_CACHE_MAX_CHARS:
+            return len(_get_encoding(self.provider, self.model).encode(text))
+        return _count_tokens(text, self.provider, self.model)
 
     def __repr__(self) -> str:
         return f"LLMClient(provider='{self.provider}', model='{self.model}')"
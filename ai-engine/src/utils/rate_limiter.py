@@ -0,0 +1,92 @@
+"""
+Rate Limiter
+Token bucket shared by LLM clients, so every request sent to the provider
+counts against one budget
+"""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request would have to wait longer than the limiter allows"""
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(f"LLM rate limit exceeded, retry in {retry_after:.1f}s")
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket for outbound LLM requests
+
+    Each request reserves the next free slot under a lock and then waits
+    outside it, so waiters never queue behind one another's sleeps. A request
+    whose slot is more than max_wait seconds away fails fast with
+    RateLimitExceeded instead of waiting.
+    """
+
+    def __init__(self, max_per_minute: float, max_wait: float = 10.0):
+        """
+        Initialize the bucket
+
+        Args:
+            max_per_minute: Requests allowed per minute (also the burst size)
+            max_wait: Longest a request may wait for its slot, in seconds
+        """
+        self.capacity = max_per_minute
+        self.fill_rate = max_per_minute / 60.0
+        self.max_wait = max_wait
+        self._tokens = float(max_per_minute)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> float:
+        """Top up tokens for the time elapsed; call with the lock held"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+        self._updated = now
+        return self._tokens
+
+    def check(self) -> None:
+        """
+        Fail fast when a request made now would be turned away, without taking a slot
+
+        Raises:
+            RateLimitExceeded: If the next free slot is more than max_wait away
+        """
+        with self._lock:
+            wait = (1 - self._refill()) / self.fill_rate
+        if wait > self.max_wait:
+            raise RateLimitExceeded(wait)
+
+    def reserve(self) -> float:
+        """
+        Take a slot and return how long to wait before using it
+
+        Returns:
+            Seconds until the slot is free (0 when a token is available now)
+
+        Raises:
+            RateLimitExceeded: If the wait would exceed max_wait; no slot is taken
+        """
+        with self._lock:
+            wait = max(0.0, (1 - self._refill()) / self.fill_rate)
+            if wait > self.max_wait:
+                raise RateLimitExceeded(wait)
+            # May go negative: later callers then reserve slots further out
+            self._tokens -= 1
+            return wait
+
+    def acquire(self) -> None:
+        """Block until a slot is free"""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait for a free slot without blocking the event loop"""
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
@@ -0,0 +1,72 @@
+"""
+Response Cache
+Opt-in on-disk cache of LLM responses, so repeated runs of the same prompts
+(mainly the test suite) skip the provider round trip
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+
+def response_cache_enabled() -> bool:
+    """True when PREPWISE_CACHE=1, read per call so tests can toggle it"""
+    return os.getenv("PREPWISE_CACHE") == "1"
+
+
+def _cache_dir() -> Path:
+    """Cache location: PREPWISE_CACHE_DIR, or ~/.cache/prepwise"""
+    return Path(os.getenv("PREPWISE_CACHE_DIR") or Path.home() / ".cache" / "prepwise")
+
+
+def response_cache_key(*request: Any) -> str:
+    """
+    SHA-256 key for everything that shapes a response
+
+    Args:
+        *request: Provider, model, prompts and sampling settings of the call
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = json.dumps(request, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_cached_response(key: str) -> Optional[str]:
+    """
+    Look up a cached response
+
+    Args:
+        key: Key from response_cache_key()
+
+    Returns:
+        The cached response text, or None on a miss
+    """
+    try:
+        return (_cache_dir() / f"{key}.txt").read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def cache_response(key: str, response: str) -> None:
+    """
+    Store a response, written atomically so concurrent runs never read half a file
+
+    Args:
+        key: Key from response_cache_key()
+        response: Response text to store
+    """
+    cache_dir = _cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(response)
+        os.replace(tmp_path, cache_dir / f"{key}.txt")
+    except OSError:
+        # Caching is best effort; the response itself was already obtained
+        pass
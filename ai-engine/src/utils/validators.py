@@ -5,7 +5,15 @@ Utility functions for data validation and sanitization
 
 import re
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, Optional, List
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^https?://[^\s]+$')
+_WHITESPACE_RE = re.compile(r'\s+')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]')
+# Patterns like "2 years", "3-5 years", "6 months"
+_YEARS_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:years?|yrs?)', re.IGNORECASE)
+_MONTHS_RE = re.compile(r'(\d+)\s*(?:months?|mos?)', re.IGNORECASE)
 
 
 def validate_file_path(file_path: str, allowed_extensions: Optional[List[str]] = None) -> Path:
@@ -54,8 +62,21 @@ def validate_email(email: str) -> bool:
     if not email:
         return False
 
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
+
+
+def validate_emails(emails: Iterable[Optional[str]]) -> List[bool]:
+    """
+    Validate many email addresses, e.g. every contact in a batch of resumes
+
+    Args:
+        emails: Email addresses (empty or None entries are invalid)
+
+    Returns:
+        One validate_email() result per address, in order
+    """
+    match = _EMAIL_RE.match
+    return [bool(email and match(email)) for email in emails]
 
 
 def validate_url(url: str) -> bool:
@@ -71,8 +92,7 @@ def validate_url(url: str) -> bool:
     if not url:
         return False
 
-    pattern = r'^https?://[^\s]+$'
-    return bool(re.match(pattern, url))
+    return bool(_URL_RE.match(url))
 
 
 def sanitize_text(text: str, max_length: Optional[int] = None) -> str:
@@ -90,10 +110,10 @@ def sanitize_text(text: str, max_length: Optional[int] = None) -> str:
         return ""
 
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
 
     # Remove null bytes and control characters
-    text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
+    text = _CONTROL_CHARS_RE.sub('', text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -144,21 +164,17 @@ def extract_years_of_experience(text: str) -> Optional[float]:
     Returns:
         Years as float, or None if not found
     """
-    # Patterns like "2 years", "3-5 years", "6 months"
-    year_pattern = r'(\d+(?:\.\d+)?)\s*(?:years?|yrs?)'
-    month_pattern = r'(\d+)\s*(?:months?|mos?)'
-
     years = 0.0
 
-    # Find years
-    year_matches = re.findall(year_pattern, text, re.IGNORECASE)
-    if year_matches:
-        years += float(year_matches[0])
+    # Find years (only the first mention counts)
+    year_match = _YEARS_RE.search(text)
+    if year_match:
+        years += float(year_match.group(1))
 
     # Find months and convert to years
-    month_matches = re.findall(month_pattern, text, re.IGNORECASE)
-    if month_matches:
-        years += float(month_matches[0]) / 12
+    month_match = _MONTHS_RE.search(text)
+    if month_match:
+        years += float(month_match.group(1)) / 12
 
     return years if years > 0 else None
 
@@ -0,0 +1,36 @@
+"""
+Shared test fixtures
+"""
+import os
+import tempfile
+
+# Reuse cached LLM responses for the suite's fixed temperature-0 prompts across
+# runs, kept apart from any user cache; set PREPWISE_CACHE=0 to always call the
+# provider
+os.environ.setdefault("PREPWISE_CACHE", "1")
+os.environ.setdefault(
+    "PREPWISE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "prepwise-test-cache")
+)
+
+import pytest
+from src.evaluator.evaluator import AnswerEvaluator
+from src.question_generator.generator import QuestionGenerator
+from src.utils.llm_client import LLMClient
+
+
+@pytest.fixture(scope="session")
+def llm_client():
+    """One LLM client, and so one connection pool, for the whole test run"""
+    return LLMClient()
+
+
+@pytest.fixture(scope="session")
+def question_generator(llm_client):
+    """Question generator shared by the tests that only call it"""
+    return QuestionGenerator(llm_client=llm_client)
+
+
+@pytest.fixture(scope="session")
+def answer_evaluator(llm_client):
+    """Answer evaluator shared by the tests that only call it"""
+    return AnswerEvaluator(llm_client=llm_client)
@@ -1,9 +1,14 @@
 """
 Tests for Answer Evaluator
 """
+import asyncio
 import pytest
+from unittest.mock import Mock
 from src.evaluator.evaluator import AnswerEvaluator
+from src.utils.llm_client import LLMClient
+from src.utils.rate_limiter import RateLimiter, RateLimitExceeded
 from src.evaluator.schemas import (
+    AnswerEvaluation,
     EvaluationRequest,
     BatchEvaluationRequest,
     EvaluationCriteria,
@@ -12,17 +17,17 @@ from src.evaluator.schemas import (
 )
 
 
-def test_evaluator_initialization():
+def test_evaluator_initialization(answer_evaluator):
     """Test answer evaluator can be initialized"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     assert evaluator is not None
     assert evaluator.llm_client is not None
     assert len(evaluator.criteria_definitions) > 0
 
 
-def test_evaluate_technical_answer():
+def test_evaluate_technical_answer(answer_evaluator):
     """Test evaluating a technical answer"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     request = EvaluationRequest(
         question="Explain how a hash table works",
@@ -49,11 +54,14 @@ def test_evaluate_technical_answer():
     assert evaluation.evaluation_id.startswith("eval_")
     assert evaluation.answer_text == request.answer
     assert evaluation.question_text == request.question
+    
+    # The whole evaluation survives a JSON round trip through its schema
+    assert AnswerEvaluation.model_validate(evaluation.model_dump(mode="json")) == evaluation
 
 
-def test_evaluate_behavioral_answer():
+def test_evaluate_behavioral_answer(answer_evaluator):
     """Test evaluating a behavioral answer"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     request = EvaluationRequest(
         question="Tell me about a time you had to work with a difficult team member",
@@ -77,9 +85,9 @@ def test_evaluate_behavioral_answer():
     assert evaluation.question_type == "behavioral"
 
 
-def test_poor_answer_evaluation():
+def test_poor_answer_evaluation(answer_evaluator):
     """Test evaluating a poor/short answer"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     request = EvaluationRequest(
         question="Explain the difference between TCP and UDP",
@@ -98,9 +106,9 @@ def test_poor_answer_evaluation():
     assert len(completeness_weaknesses) > 0
 
 
-def test_excellent_answer_evaluation():
+def test_excellent_answer_evaluation(answer_evaluator):
     """Test evaluating an excellent answer"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     request = EvaluationRequest(
         question="What is a RESTful API?",
@@ -132,9 +140,9 @@ def test_excellent_answer_evaluation():
     assert len(evaluation.strengths) > 0
 
 
-def test_criterion_scores():
+def test_criterion_scores(answer_evaluator):
     """Test that criterion scores are calculated"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     request = EvaluationRequest(
         question="What is polymorphism in OOP?",
@@ -152,9 +160,9 @@ def test_criterion_scores():
         assert cs.weight > 0
 
 
-def test_feedback_items():
+def test_feedback_items(answer_evaluator):
     """Test that feedback items are generated"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     request = EvaluationRequest(
         question="Explain database indexing",
@@ -178,9 +186,9 @@ def test_feedback_items():
         assert len(weakness.message) > 0
 
 
-def test_batch_evaluation():
+def test_batch_evaluation(answer_evaluator):
     """Test evaluating multiple answers in batch"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     batch_request = BatchEvaluationRequest(
         session_id="test_session_123",
@@ -212,9 +220,9 @@ def test_batch_evaluation():
     assert summary.average_score <= 100
 
 
-def test_session_summary_generation():
+def test_session_summary_generation(answer_evaluator):
     """Test session summary generation"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     # Create mock evaluations
     from src.evaluator.schemas import AnswerEvaluation
@@ -239,9 +247,9 @@ def test_session_summary_generation():
     assert summary.hiring_recommendation in ["strong_yes", "yes", "maybe", "no"]
 
 
-def test_missing_expected_points():
+def test_missing_expected_points(answer_evaluator):
     """Test identification of missing points"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     request = EvaluationRequest(
         question="Explain the SOLID principles",
@@ -262,9 +270,9 @@ def test_missing_expected_points():
     assert len(evaluation.missing_points) > 0 or evaluation.overall_score < 80
 
 
-def test_evaluation_with_context():
+def test_evaluation_with_context(answer_evaluator):
     """Test evaluation with candidate context"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     request = EvaluationRequest(
         question="How would you implement authentication?",
@@ -284,9 +292,9 @@ def test_evaluation_with_context():
     assert evaluation.overall_score >= 0
 
 
-def test_answer_comparison():
+def test_answer_comparison(answer_evaluator):
     """Test comparing two answers"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     request1 = EvaluationRequest(
         question="What is recursion?",
@@ -315,9 +323,9 @@ def test_answer_comparison():
     assert abs(comparison["score_difference"]) > 0
 
 
-def test_high_priority_feedback():
+def test_high_priority_feedback(answer_evaluator):
     """Test filtering high-priority feedback"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     request = EvaluationRequest(
         question="Explain memory management in Python",
@@ -338,9 +346,9 @@ def test_high_priority_feedback():
         assert weakness.priority == "high"
 
 
-def test_feedback_by_category():
+def test_feedback_by_category(answer_evaluator):
     """Test filtering feedback by category"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     request = EvaluationRequest(
         question="What is a design pattern?",
@@ -360,9 +368,9 @@ def test_feedback_by_category():
         assert "suggestions" in category_feedback
 
 
-def test_evaluation_id_uniqueness():
+def test_evaluation_id_uniqueness(answer_evaluator):
     """Test that evaluation IDs are unique"""
-    evaluator = AnswerEvaluator()
+    evaluator = answer_evaluator
     
     request = EvaluationRequest(
         question="Test question",
@@ -378,5 +386,94 @@ def test_evaluation_id_uniqueness():
     assert eval2.evaluation_id.startswith("eval_")
 
 
+
+def test_batch_evaluation_sends_answers_concurrently():
+    """Test a batch makes one concurrent LLM request, falling back per failed answer"""
+    llm_client = Mock(model="gpt-4")
+    llm_client.generate_json_batch.return_value = [
+        {"overall_score": 82, "score_level": "good"},
+        RuntimeError("rate limited"),
+    ]
+    evaluator = AnswerEvaluator(llm_client=llm_client)
+    
+    batch_request = BatchEvaluationRequest(
+        session_id="test_session_123",
+        evaluations=[
+            EvaluationRequest(
+                question="What is a binary search tree?",
+                answer="A BST keeps smaller keys on the left and larger keys on the right.",
+                question_type="technical"
+            ),
+            EvaluationRequest(
+                question="Describe a challenging project",
+                answer="I led a migration to microservices, for example splitting billing out first.",
+                question_type="behavioral"
+            )
+        ],
+        generate_summary=False
+    )
+    
+    evaluations, summary = evaluator.evaluate_batch(batch_request)
+    
+    llm_client.generate_json_batch.assert_called_once()
+    llm_client.generate_json.assert_not_called()
+    assert len(llm_client.generate_json_batch.call_args.args[0]) == 2
+    assert evaluations[0].overall_score == 82
+    assert evaluations[1].evaluator_model == "gpt-4"
+    assert all(e.session_id == "test_session_123" for e in evaluations)
+    assert summary is None
+
+
+
+def test_batch_evaluation_inside_running_event_loop():
+    """Test a batch from inside an event loop still reaches the LLM, not the fallback"""
+    llm_client = LLMClient(api_key="sk-test")
+    llm_client.generate = Mock(return_value='{"overall_score": 82, "score_level": "good"}')
+    evaluator = AnswerEvaluator(llm_client=llm_client)
+    
+    batch_request = BatchEvaluationRequest(
+        session_id="test_session_123",
+        evaluations=[
+            EvaluationRequest(question="What is a hash map?", answer="A key-value table.", question_type="technical"),
+            EvaluationRequest(question="Describe a conflict", answer="I talked it through.", question_type="behavioral")
+        ],
+        generate_summary=False
+    )
+    
+    async def evaluate_in_loop():
+        return evaluator.evaluate_batch(batch_request)
+    
+    evaluations, _ = asyncio.run(evaluate_in_loop())
+    
+    assert llm_client.generate.call_count == 2
+    assert [e.overall_score for e in evaluations] == [82, 82]
+
+
+def test_failed_llm_call_marks_fallback_evaluation():
+    """Test the rule-based score used after an LLM error is flagged as a fallback"""
+    llm_client = LLMClient(api_key="sk-test")
+    llm_client.generate_json = Mock(side_effect=[RuntimeError("provider down"), {"overall_score": 82, "score_level": "good"}])
+    evaluator = AnswerEvaluator(llm_client=llm_client)
+    request = EvaluationRequest(question="What is a hash map?", answer="A key-value table.", question_type="technical")
+    
+    assert evaluator.evaluate_answer(request).is_fallback
+    assert not evaluator.evaluate_answer(request).is_fallback
+
+
+def test_evaluation_raises_when_rate_limited(monkeypatch):
+    """Test an exhausted rate limiter surfaces as RateLimitExceeded, not a fallback score"""
+    monkeypatch.setenv("PREPWISE_CACHE", "0")
+    rate_limiter = RateLimiter(1, max_wait=0)
+    rate_limiter.reserve()
+    evaluator = AnswerEvaluator(llm_client=LLMClient(api_key="sk-test", rate_limiter=rate_limiter))
+    request = EvaluationRequest(question="What is a hash map?", answer="A key-value table.", question_type="technical")
+    batch_request = BatchEvaluationRequest(session_id="test_session_123", evaluations=[request], generate_summary=False)
+    
+    with pytest.raises(RateLimitExceeded):
+        evaluator.evaluate_answer(request)
+    with pytest.raises(RateLimitExceeded):
+        evaluator.evaluate_batch(batch_request)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,34 @@
+"""
+Tests for LLM Client response caching
+"""
+import pytest
+from unittest.mock import Mock
+from src.utils.llm_client import LLMClient
+
+
+@pytest.fixture
+def caching_client(monkeypatch, tmp_path):
+    """Client with the response cache on in an empty directory and a stubbed provider call"""
+    monkeypatch.setenv("PREPWISE_CACHE", "1")
+    monkeypatch.setenv("PREPWISE_CACHE_DIR", str(tmp_path))
+    client = LLMClient(api_key="sk-test")
+    client._generate_openai = Mock(side_effect=["first", "second"])
+    return client
+
+
+def test_deterministic_request_is_cached(caching_client):
+    """Test a temperature-0 request is answered from the cache the second time"""
+    assert caching_client.generate("Say hi", temperature=0) == "first"
+    assert caching_client.generate("Say hi", temperature=0) == "first"
+    assert caching_client._generate_openai.call_count == 1
+
+
+def test_sampled_request_is_not_cached(caching_client):
+    """Test a request at a non-zero temperature always reaches the provider"""
+    assert caching_client.generate("Say hi", temperature=0.7) == "first"
+    assert caching_client.generate("Say hi", temperature=0.7) == "second"
+    assert caching_client._generate_openai.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,7 +1,10 @@
 """
 Tests for Question Generator
 """
+import asyncio
+import json
 import pytest
+from unittest.mock import AsyncMock, Mock
 from src.question_generator.generator import QuestionGenerator
 from src.question_generator.schemas import (
     QuestionGenerationRequest,
@@ -10,56 +13,62 @@ from src.question_generator.schemas import (
     InterviewQuestion,
     QuestionSet
 )
+from src.utils.llm_client import LLMClient
+from src.utils.rate_limiter import RateLimiter, RateLimitExceeded
 
 
-def test_question_generator_initialization():
+def test_question_generator_initialization(question_generator):
     """Test question generator can be initialized"""
-    generator = QuestionGenerator()
+    generator = question_generator
     assert generator is not None
     assert generator.llm_client is not None
 
 
-def test_generate_technical_questions():
-    """Test generating technical questions"""
-    generator = QuestionGenerator()
-    
-    request = QuestionGenerationRequest(
-        target_role="Software Engineer",
-        target_level="mid",
-        num_technical=3,
-        num_behavioral=0
-    )
-    
-    result = generator.generate_questions(request)
-    
-    assert result is not None
-    assert len(result.questions) == 3
-    assert all(q.type == QuestionType.TECHNICAL for q in result.questions)
-    assert result.technical_count == 3
-
-
-def test_generate_behavioral_questions():
-    """Test generating behavioral questions"""
-    generator = QuestionGenerator()
-    
-    request = QuestionGenerationRequest(
-        target_role="Product Manager",
-        target_level="senior",
-        num_technical=0,
-        num_behavioral=3
+@pytest.mark.parametrize("request_kwargs,expected_type,count_attr", [
+    (
+        dict(target_role="Software Engineer", target_level="mid", num_technical=3, num_behavioral=0),
+        QuestionType.TECHNICAL,
+        "technical_count",
+    ),
+    (
+        dict(target_role="Product Manager", target_level="senior", num_technical=0, num_behavioral=3),
+        QuestionType.BEHAVIORAL,
+        "behavioral_count",
+    ),
+    (
+        dict(
+            target_role="Senior Software Engineer",
+            target_level="senior",
+            num_technical=0,
+            num_behavioral=0,
+            num_system_design=2
+        ),
+        QuestionType.SYSTEM_DESIGN,
+        None,
+    ),
+], ids=["technical", "behavioral", "system_design"])
+def test_generate_single_type_questions(question_generator, request_kwargs, expected_type, count_attr):
+    """Test generating questions of a single type"""
+    generator = question_generator
+    
+    request = QuestionGenerationRequest(**request_kwargs)
+    expected_count = (
+        request.num_technical + request.num_behavioral
+        + request.num_situational + request.num_system_design
     )
     
     result = generator.generate_questions(request)
     
     assert result is not None
-    assert len(result.questions) == 3
-    assert all(q.type == QuestionType.BEHAVIORAL for q in result.questions)
-    assert result.behavioral_count == 3
+    assert len(result.questions) == expected_count
+    assert all(q.type == expected_type for q in result.questions)
+    if count_attr:
+        assert getattr(result, count_attr) == expected_count
 
 
-def test_generate_mixed_questions():
+def test_generate_mixed_questions(question_generator):
     """Test generating mixed question types"""
-    generator = QuestionGenerator()
+    generator = question_generator
     
     request = QuestionGenerationRequest(
         target_role="Full Stack Developer",
@@ -77,28 +86,9 @@ def test_generate_mixed_questions():
     assert result.behavioral_count == 2
 
 
-def test_generate_system_design_questions():
-    """Test generating system design questions"""
-    generator = QuestionGenerator()
-    
-    request = QuestionGenerationRequest(
-        target_role="Senior Software Engineer",
-        target_level="senior",
-        num_technical=0,
-        num_behavioral=0,
-        num_system_design=2
-    )
-    
-    result = generator.generate_questions(request)
-    
-    assert result is not None
-    assert len(result.questions) == 2
-    assert all(q.type == QuestionType.SYSTEM_DESIGN for q in result.questions)
-
-
-def test_question_set_filters():
+def test_question_set_filters(question_generator):
     """Test question set filtering methods"""
-    generator = QuestionGenerator()
+    generator = question_generator
     
     request = QuestionGenerationRequest(
         target_role="Data Scientist",
@@ -117,14 +107,17 @@ def test_question_set_filters():
     assert len(behavioral_qs) == 2
 
 
-def test_session_id_generation():
+def test_session_id_generation(question_generator):
     """Test unique session IDs are generated"""
-    generator = QuestionGenerator()
+    generator = question_generator
     
+    # Session IDs are generated locally, so use a template-only request and skip the LLM
     request = QuestionGenerationRequest(
         target_role="DevOps Engineer",
         target_level="mid",
-        num_technical=1
+        num_technical=0,
+        num_behavioral=0,
+        num_system_design=1
     )
     
     result1 = generator.generate_questions(request)
@@ -135,9 +128,9 @@ def test_session_id_generation():
     assert result2.session_id.startswith("sess_")
 
 
-def test_question_structure():
+def test_question_structure(question_generator):
     """Test that generated questions have proper structure"""
-    generator = QuestionGenerator()
+    generator = question_generator
     
     request = QuestionGenerationRequest(
         target_role="Software Engineer",
@@ -150,12 +143,12 @@ def test_question_structure():
     assert len(result.questions) > 0
     
     question = result.questions[0]
-    assert hasattr(question, 'question')
-    assert hasattr(question, 'type')
-    assert hasattr(question, 'difficulty')
-    assert hasattr(question, 'category')
-    assert hasattr(question, 'skills_tested')
-    assert hasattr(question, 'expected_duration_minutes')
+    required = {
+        'question', 'type', 'difficulty', 'category',
+        'skills_tested', 'expected_duration_minutes'
+    }
+    missing = required - type(question).model_fields.keys()
+    assert not missing, f"missing fields: {missing}"
     
     assert isinstance(question.question, str)
     assert len(question.question) > 0
@@ -163,9 +156,9 @@ def test_question_structure():
     assert isinstance(question.difficulty, DifficultyLevel)
 
 
-def test_difficulty_levels():
+def test_difficulty_levels(question_generator):
     """Test questions are generated with appropriate difficulty"""
-    generator = QuestionGenerator()
+    generator = question_generator
     
     # Junior level should have easier questions
     junior_request = QuestionGenerationRequest(
@@ -190,9 +183,9 @@ def test_difficulty_levels():
     assert len(senior_result.questions) == 2
 
 
-def test_focus_areas():
+def test_focus_areas(question_generator):
     """Test question generation with focus areas"""
-    generator = QuestionGenerator()
+    generator = question_generator
     
     request = QuestionGenerationRequest(
         target_role="Software Engineer",
@@ -207,9 +200,9 @@ def test_focus_areas():
     assert result.target_role == "Software Engineer"
 
 
-def test_question_duration():
+def test_question_duration(question_generator):
     """Test that questions have reasonable durations"""
-    generator = QuestionGenerator()
+    generator = question_generator
     
     request = QuestionGenerationRequest(
         target_role="Software Engineer",
@@ -225,9 +218,9 @@ def test_question_duration():
     assert total_duration < 200  # Reasonable upper bound
 
 
-def test_resume_context():
+def test_resume_context(question_generator):
     """Test question generation with resume context"""
-    generator = QuestionGenerator()
+    generator = question_generator
     
     resume_data = {
         "skills": {
@@ -252,5 +245,142 @@ def test_resume_context():
     assert len(result.questions) == 2
 
 
+def test_parse_llm_response_with_fenced_json():
+    """Test parsing tolerates markdown fences and a preamble around the JSON"""
+    generator = QuestionGenerator(llm_client=Mock())
+
+    response = (
+        "Here are the questions:\n```json\n"
+        '[{"question": "What is a closure?", "difficulty": "Easy", '
+        '"category": "javascript", "skills_tested": ["js"], "duration": "10 minutes"}]'
+        "\n```"
+    )
+    request = QuestionGenerationRequest(target_role="Software Engineer")
+
+    questions = generator._parse_llm_response(response, QuestionType.TECHNICAL, request)
+
+    assert len(questions) == 1
+    assert questions[0].question == "What is a closure?"
+    assert questions[0].difficulty == DifficultyLevel.EASY
+    assert questions[0].expected_duration_minutes == 10
+
+
+def test_parse_large_llm_response_with_brackets_in_strings():
+    """Test a long response keeps every question when question text contains brackets"""
+    generator = QuestionGenerator(llm_client=Mock())
+
+    question = {
+        "question": "What does arr[-1] return, and what about arr[1:]? " + "x" * 600,
+        "difficulty": "medium",
+        "category": "python",
+        "skills_tested": ["python"],
+        "duration": 5
+    }
+    response = "Here are the questions:\n" + json.dumps([question] * 100)
+    request = QuestionGenerationRequest(target_role="Software Engineer")
+
+    questions = generator._parse_llm_response(response, QuestionType.TECHNICAL, request)
+
+    assert len(response) > 50_000
+    assert len(questions) == 100
+    assert questions[0].question.startswith("What does arr[-1] return")
+
+
+
+def test_llm_questions_generated_in_one_batch():
+    """Test technical and behavioral prompts share one batch, with per-type fallback"""
+    llm_client = Mock()
+    llm_client.generate_batch.return_value = [
+        '[{"question": "What is a closure?", "difficulty": "easy", '
+        '"category": "javascript", "skills_tested": ["js"], "duration": 5}]',
+        RuntimeError("rate limited"),
+    ]
+    generator = QuestionGenerator(llm_client=llm_client)
+
+    request = QuestionGenerationRequest(
+        target_role="Software Engineer",
+        target_level="mid",
+        num_technical=1,
+        num_behavioral=2
+    )
+
+    result = generator.generate_questions(request)
+
+    llm_client.generate_batch.assert_called_once()
+    llm_client.generate.assert_not_called()
+    assert len(llm_client.generate_batch.call_args.args[0]) == 2
+    assert llm_client.generate_batch.call_args.kwargs["overrides"] == [
+        {"temperature": 0.8, "max_tokens": 2000},
+        {"temperature": 0.7, "max_tokens": 1500},
+    ]
+    assert result.questions[0].question == "What is a closure?"
+    assert len(result.get_questions_by_type(QuestionType.TECHNICAL)) == 1
+    assert len(result.get_questions_by_type(QuestionType.BEHAVIORAL)) == 2
+
+
+
+def test_agenerate_questions_runs_requests_concurrently():
+    """Test several requests can be generated together with asyncio.gather"""
+    llm_client = Mock()
+    llm_client.generate_async = AsyncMock(return_value=(
+        '[{"question": "What is a closure?", "difficulty": "easy", '
+        '"category": "javascript", "skills_tested": ["js"], "duration": 5}]'
+    ))
+    generator = QuestionGenerator(llm_client=llm_client)
+
+    requests = [
+        QuestionGenerationRequest(target_role="Software Engineer", num_technical=1, num_behavioral=0),
+        QuestionGenerationRequest(target_role="Product Manager", num_technical=0, num_behavioral=1),
+    ]
+
+    async def generate_all():
+        return await asyncio.gather(*(generator.agenerate_questions(r) for r in requests))
+
+    technical_set, behavioral_set = asyncio.run(generate_all())
+
+    assert llm_client.generate_async.await_count == 2
+    assert technical_set.questions[0].type == QuestionType.TECHNICAL
+    assert behavioral_set.questions[0].type == QuestionType.BEHAVIORAL
+    assert technical_set.target_role == "Software Engineer"
+
+
+def test_generate_questions_inside_running_event_loop():
+    """Test a batch from inside an event loop still reaches the LLM, not the templates"""
+    llm_client = LLMClient(api_key="sk-test")
+    llm_client.generate = Mock(return_value=(
+        '[{"question": "What is a closure?", "difficulty": "easy", '
+        '"category": "javascript", "skills_tested": ["js"], "duration": 5}]'
+    ))
+    generator = QuestionGenerator(llm_client=llm_client)
+    request = QuestionGenerationRequest(
+        target_role="Software Engineer", num_technical=1, num_behavioral=1
+    )
+
+    async def generate_in_loop():
+        return generator.generate_questions(request)
+
+    result = asyncio.run(generate_in_loop())
+
+    assert llm_client.generate.call_count == 2
+    assert {c.kwargs["temperature"] for c in llm_client.generate.call_args_list} == {0.8, 0.7}
+    assert all(q.question == "What is a closure?" for q in result.questions)
+
+
+def test_generate_questions_raises_when_rate_limited(monkeypatch):
+    """Test an exhausted rate limiter surfaces as RateLimitExceeded, not template questions"""
+    monkeypatch.setenv("PREPWISE_CACHE", "0")
+    rate_limiter = RateLimiter(1, max_wait=0)
+    rate_limiter.reserve()
+    generator = QuestionGenerator(llm_client=LLMClient(api_key="sk-test", rate_limiter=rate_limiter))
+    request = QuestionGenerationRequest(
+        target_role="Software Engineer", num_technical=1, num_behavioral=1
+    )
+
+    with pytest.raises(RateLimitExceeded):
+        generator.generate_questions(request)
+    with pytest.raises(RateLimitExceeded):
+        asyncio.run(generator.agenerate_questions(request))
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
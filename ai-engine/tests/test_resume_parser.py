@@ -3,16 +3,24 @@ Unit Tests for Resume Parser
 """
 
 import pytest
+import re
 import tempfile
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock, patch
 import PyPDF2
 from docx import Document
 
+from src.resume_parser import extractors
 from src.resume_parser.extractors import TextExtractor, extract_text
-from src.resume_parser.parser import ResumeParser, parse_resume
+from src.resume_parser.parser import (
+    ResumeParser, parse_resume, SECTION_FIELDS, LONG_RESUME_CHARS, _segment_by_headings,
+    _get_parser
+)
 from src.resume_parser.schemas import ParsedResume, Contact
+from src.utils.llm_client import LLMClient
+from src.utils.rate_limiter import RateLimiter, RateLimitExceeded
 
 
 class TestTextExtractor:
@@ -62,6 +70,11 @@ class TestTextExtractor:
         with pytest.raises(ValueError, match="PDF file not found"):
             TextExtractor.extract_from_pdf("nonexistent.pdf")
 
+    def test_extract_from_pdf_unsupported_backend(self):
+        """Test PDF extraction rejects unknown backends"""
+        with pytest.raises(ValueError, match="Unsupported PDF backend"):
+            TextExtractor.extract_from_pdf("resume.pdf", backend="pdfminer")
+
     def test_extract_from_docx_file_not_found(self):
         """Test DOCX extraction with non-existent file"""
         with pytest.raises(ValueError, match="DOCX file not found"):
@@ -111,6 +124,41 @@ class TestTextExtractor:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
 
+    @pytest.mark.parametrize("backend", [
+        "pypdf2",
+        pytest.param("pymupdf", marks=pytest.mark.skipif(
+            extractors.pymupdf is None, reason="PyMuPDF not installed"
+        )),
+    ])
+    @pytest.mark.parametrize("use_pool", [False, True])
+    def test_extract_from_multipage_pdf_preserves_page_order(self, backend, use_pool):
+        """Test sequential and pooled PDF extraction keep pages in document order"""
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
+            tmp_path = tmp.name
+
+        try:
+            from reportlab.pdfgen import canvas
+            from reportlab.lib.pagesizes import letter
+
+            c = canvas.Canvas(tmp_path, pagesize=letter)
+            for page_num in range(1, 5):
+                c.drawString(100, 750, f"Page marker {page_num}")
+                c.showPage()
+            c.save()
+
+            if use_pool:
+                with ProcessPoolExecutor(max_workers=2) as executor:
+                    text = TextExtractor.extract_from_pdf(tmp_path, backend=backend, executor=executor)
+            else:
+                text = TextExtractor.extract_from_pdf(tmp_path, backend=backend)
+
+            positions = [text.index(f"Page marker {n}") for n in range(1, 5)]
+            assert positions == sorted(positions)
+
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
     def test_extract_from_docx_success(self):
         """Test successful DOCX text extraction"""
         with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
@@ -319,6 +367,187 @@ class TestResumeParser:
         assert resume.contact.name == "John Doe"
         assert mock_llm_client.generate_json.called
 
+    def test_parse_resume_from_text_decomposed_merges_sections(self, mock_llm_client, sample_llm_response):
+        """Test decomposed parsing issues one call per section and merges only owned fields"""
+        def section_response(prompt, **kwargs):
+            # Each call answers with its own fields plus a bogus contact that must be ignored
+            response = {"contact": {"name": "Wrong Name"}}
+            for section, fields in SECTION_FIELDS.items():
+                if f"top-level fields: {', '.join(fields)}" in prompt:
+                    response.update({field: sample_llm_response[field] for field in fields})
+            return response
+
+        mock_llm_client.generate_json = Mock(side_effect=section_response)
+        parser = ResumeParser(llm_client=mock_llm_client)
+
+        resume = parser.parse_resume_from_text("John Doe, Software Engineer at Google. " * 5)
+
+        assert mock_llm_client.generate_json.call_count == len(SECTION_FIELDS)
+        requested = sorted(
+            sorted(call.kwargs["schema"]["properties"])
+            for call in mock_llm_client.generate_json.call_args_list
+        )
+        assert requested == sorted(sorted(fields) for fields in SECTION_FIELDS.values())
+        assert resume.contact.name == "John Doe"
+        assert resume.experience[0].company == "Google"
+        assert resume.education[0].institution == "Stanford University"
+        assert resume.total_years_experience == 4.5
+
+    def test_parse_resume_from_text_monolithic(self, mock_llm_client, sample_llm_response):
+        """Test a single LLM call is made when decomposition is disabled"""
+        mock_llm_client.generate_json = Mock(return_value=sample_llm_response)
+        parser = ResumeParser(llm_client=mock_llm_client, decomposed=False)
+
+        resume = parser.parse_resume_from_text("John Doe, Software Engineer at Google. " * 5)
+
+        assert mock_llm_client.generate_json.call_count == 1
+        assert resume.contact.name == "John Doe"
+
+    def test_segment_by_headings(self):
+        """Test line-numbered text is split by heading and keeps its line numbers"""
+        text = (
+            "[1] John Doe\n"
+            "[2] john@example.com\n"
+            "[3] WORK EXPERIENCE\n"
+            "[4] Software Engineer at Google\n"
+            "[5] Education:\n"
+            "[6] Stanford University\n"
+            "[7] Skills\n"
+            "[8] Python, Java"
+        )
+
+        segments = _segment_by_headings(text)
+
+        assert segments["basic_info"] == "[1] John Doe\n[2] john@example.com\n[7] Skills\n[8] Python, Java"
+        assert segments["work_experience"] == "[3] WORK EXPERIENCE\n[4] Software Engineer at Google"
+        assert segments["education_plus_rest"] == "[5] Education:\n[6] Stanford University"
+
+    def test_segment_by_headings_without_headings(self):
+        """Test every section gets the full text when no headings are recognised"""
+        text = "[1] John Doe\n[2] Software Engineer at Google"
+
+        assert _segment_by_headings(text) == dict.fromkeys(SECTION_FIELDS, text)
+
+    def test_parse_long_resume_sends_sections(self, mock_llm_client, sample_llm_response):
+        """Test long resumes are split by heading even when decomposition is disabled"""
+        mock_llm_client.generate_json = Mock(return_value=sample_llm_response)
+        parser = ResumeParser(llm_client=mock_llm_client, decomposed=False)
+
+        filler = "Built and shipped features used by millions of people.\n"
+        resume_text = (
+            "John Doe\nEXPERIENCE\n" + filler * (LONG_RESUME_CHARS // len(filler))
+            + "EDUCATION\nStanford University\n"
+        )
+        parser.parse_resume_from_text(resume_text)
+
+        prompts = [call.kwargs["prompt"] for call in mock_llm_client.generate_json.call_args_list]
+        assert len(prompts) == len(SECTION_FIELDS)
+        education_prompt = next(p for p in prompts if "top-level fields: education" in p)
+        assert "Stanford University" in education_prompt
+        assert "Built and shipped" not in education_prompt
+
+    def test_parse_resume_from_text_with_braces(self, mock_llm_client, sample_llm_response):
+        """Test braces in resume text are passed through to the prompt untouched"""
+        mock_llm_client.generate_json = Mock(return_value=sample_llm_response)
+        parser = ResumeParser(llm_client=mock_llm_client, decomposed=False)
+
+        parser.parse_resume_from_text("John Doe, skilled in {Python} and dict {key: value}. " * 3)
+
+        prompt = mock_llm_client.generate_json.call_args.kwargs["prompt"]
+        assert "{Python} and dict {key: value}" in prompt
+        assert '{"lines": [start, end]}' in prompt
+        assert "{resume_text}" not in prompt and "{{" not in prompt
+
+    @pytest.mark.parametrize("decomposed", [False, True])
+    def test_parse_resume_raises_when_rate_limited(self, monkeypatch, decomposed):
+        """Test an exhausted rate limiter surfaces as RateLimitExceeded, not a parse failure"""
+        monkeypatch.setenv("PREPWISE_CACHE", "0")
+        rate_limiter = RateLimiter(1, max_wait=0)
+        rate_limiter.reserve()
+        llm_client = LLMClient(api_key="sk-test", rate_limiter=rate_limiter)
+        llm_client.count_tokens = Mock(return_value=500)
+        parser = ResumeParser(llm_client=llm_client, decomposed=decomposed)
+
+        with pytest.raises(RateLimitExceeded):
+            parser.parse_resume_from_text("John Doe, Software Engineer at Google since 2020. " * 3)
+
+    def test_parse_resume_resolves_project_line_ranges(self, mock_llm_client, sample_llm_response):
+        """Test project descriptions returned as line ranges are copied from the resume"""
+        sample_llm_response["projects"][0]["description"] = {"lines": [3, 4]}
+        mock_llm_client.generate_json = Mock(return_value=sample_llm_response)
+        parser = ResumeParser(llm_client=mock_llm_client, decomposed=False)
+
+        resume_text = (
+            "John Doe - Software Engineer at Google\n"
+            "PROJECTS\n"
+            "E-commerce Platform: built a full-stack store\n"
+            "serving 10k daily users with React and Node.js\n"
+            "SKILLS: Python, Java, JavaScript"
+        )
+        resume = parser.parse_resume_from_text(resume_text)
+
+        prompt = mock_llm_client.generate_json.call_args.kwargs["prompt"]
+        assert "[3] E-commerce Platform" in prompt
+        assert resume.projects[0].description == (
+            "E-commerce Platform: built a full-stack store "
+            "serving 10k daily users with React and Node.js"
+        )
+
+    @pytest.mark.parametrize("pointer", [[3], [3, 4, 5], ["3", "x"], [4, 3], [0, 2], [40, 50], "3-4", None])
+    def test_parse_resume_ignores_malformed_line_pointer(self, mock_llm_client, sample_llm_response, pointer):
+        """Test a malformed project line pointer leaves an empty description instead of failing the parse"""
+        sample_llm_response["projects"][0]["description"] = {"lines": pointer}
+        mock_llm_client.generate_json = Mock(return_value=sample_llm_response)
+        parser = ResumeParser(llm_client=mock_llm_client, decomposed=False)
+
+        resume = parser.parse_resume_from_text(
+            "John Doe - Software Engineer at Google\n"
+            "PROJECTS\n"
+            "E-commerce Platform: built a full-stack store\n"
+            "SKILLS: Python, Java, JavaScript"
+        )
+
+        assert resume.projects[0].name == "E-commerce Platform"
+        assert resume.projects[0].description == ""
+
+    def test_parse_resume_uses_content_hash_cache(self, mock_llm_client, sample_llm_response, tmp_path):
+        """Test parsing the same file again skips the LLM, in memory and from cache_dir"""
+        mock_llm_client.generate_json = Mock(return_value=sample_llm_response)
+
+        resume_path = tmp_path / "resume.docx"
+        doc = Document()
+        doc.add_paragraph("John Doe - Software Engineer at Google since June 2020")
+        doc.add_paragraph("Stanford University, Bachelor of Science in Computer Science")
+        doc.save(resume_path)
+
+        parser = ResumeParser(llm_client=mock_llm_client, cache_dir=str(tmp_path / "cache"))
+        first = parser.parse_resume(str(resume_path))
+        calls_after_first_parse = mock_llm_client.generate_json.call_count
+
+        second = parser.parse_resume(str(resume_path))
+        assert mock_llm_client.generate_json.call_count == calls_after_first_parse
+        assert second == first
+        assert second is not first
+
+        fresh_parser = ResumeParser(llm_client=mock_llm_client, cache_dir=str(tmp_path / "cache"))
+        assert fresh_parser.parse_resume(str(resume_path)) == first
+        assert mock_llm_client.generate_json.call_count == calls_after_first_parse
+
+    def test_cache_key_covers_parse_settings(self, mock_llm_client, tmp_path):
+        """Test the cache key is hex and changes with the model, mode and prompt"""
+        resume_path = tmp_path / "resume.txt"
+        resume_path.write_text("John Doe - Software Engineer at Google")
+        mock_llm_client.model = "openai/gpt-4o:mini"
+        parser = ResumeParser(llm_client=mock_llm_client, decomposed=False)
+        key = parser._cache_key(str(resume_path))
+
+        assert re.fullmatch(r"[0-9a-f]+", key)
+        assert ResumeParser(llm_client=mock_llm_client, decomposed=True)._cache_key(str(resume_path)) != key
+        parser.prompt_template += "\nAlso list hobbies."
+        assert parser._cache_key(str(resume_path)) != key
+        mock_llm_client.model = "gpt-4o"
+        assert ResumeParser(llm_client=mock_llm_client, decomposed=False)._cache_key(str(resume_path)) != key
+
     def test_parse_resume_to_dict(self, mock_llm_client, sample_llm_response):
         """Test parsing resume to dictionary"""
         mock_llm_client.generate_json = Mock(return_value=sample_llm_response)
@@ -392,6 +621,63 @@ class TestResumeParser:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
 
+    def test_parse_resumes_batch(self, mock_llm_client, sample_llm_response):
+        """Test batch parsing keeps input order and continues past failures"""
+        mock_llm_client.generate_json = Mock(return_value=sample_llm_response)
+
+        tmp_paths = []
+        try:
+            for _ in range(2):
+                with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
+                    tmp_paths.append(tmp.name)
+                doc = Document()
+                doc.add_paragraph("John Doe - Software Engineer at Google since June 2020")
+                doc.add_paragraph("Stanford University, Bachelor of Science in Computer Science")
+                doc.save(tmp_paths[-1])
+
+            paths = [tmp_paths[0], "nonexistent.docx", tmp_paths[1]]
+            progress = []
+
+            parser = ResumeParser(llm_client=mock_llm_client)
+            results = parser.parse_resumes_batch(
+                paths,
+                max_workers=2,
+                progress_callback=lambda done, total, result: progress.append((done, total))
+            )
+
+            assert [r['path'] for r in results] == paths
+            assert [r['status'] for r in results] == ['success', 'error', 'success']
+            assert results[0]['resume'].contact.name == "John Doe"
+            assert 'error' in results[1]
+            assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+
+        finally:
+            for tmp_path in tmp_paths:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+
+    def test_get_parsing_stats_reuses_parse_token_counts(self, mock_llm_client, sample_llm_response, tmp_path):
+        """Test stats count each prompt and LLM response once"""
+        mock_llm_client.generate_json = Mock(return_value=sample_llm_response)
+
+        resume_path = tmp_path / "resume.docx"
+        doc = Document()
+        doc.add_paragraph("John Doe - Software Engineer at Google since June 2020")
+        doc.add_paragraph("Stanford University, Bachelor of Science in Computer Science")
+        doc.save(resume_path)
+
+        parser = ResumeParser(llm_client=mock_llm_client)
+        parser.get_parsing_stats(str(resume_path))
+        mock_llm_client.count_tokens.reset_mock()
+        result = parser.get_parsing_stats(str(resume_path))
+
+        # Template prefix/suffix tokens are counted once, so later calls only tokenize
+        # the resume text plus one response per section (500 tokens each from the mock)
+        assert mock_llm_client.count_tokens.call_count == 1 + len(SECTION_FIELDS)
+        assert result['stats']['tokens_used']['input'] == 1500 * len(SECTION_FIELDS)
+        assert result['stats']['tokens_used']['output'] == 500 * len(SECTION_FIELDS)
+        assert result['resume']['contact']['name'] == "John Doe"
+
 
 class TestConvenienceFunctions:
     """Test convenience functions"""
@@ -414,6 +700,22 @@ class TestConvenienceFunctions:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
 
+    def test_parse_resume_function_reuses_parser(self):
+        """Test parse_resume builds one ResumeParser per model"""
+        _get_parser.cache_clear()
+        try:
+            with patch('src.resume_parser.parser.ResumeParser') as mock_parser_cls:
+                parse_resume("first.pdf")
+                parse_resume("second.pdf")
+                parse_resume("third.pdf", model="gpt-4o")
+
+            assert mock_parser_cls.call_count == 2
+            mock_parser_cls.assert_any_call(model="gpt-4o-mini")
+            mock_parser_cls.assert_any_call(model="gpt-4o")
+            assert mock_parser_cls.return_value.parse_resume.call_count == 3
+        finally:
+            _get_parser.cache_clear()
+
 
 # Integration test (requires API key)
 @pytest.mark.integration
@@ -7,7 +7,9 @@ from src.session_manager.schemas import (
     SessionCreateRequest,
     SessionStatus,
     InterviewMode,
-    SessionType
+    SessionType,
+    InterviewSession,
+    QuestionResponse
 )
 
 
@@ -398,5 +400,63 @@ def test_session_metrics_calculation():
     assert updated.technical_score is not None
 
 
+def test_session_from_json_round_trip():
+    """Test sessions load back from their persisted JSON form"""
+    session = InterviewSession(
+        candidate_name="Json User",
+        target_role="Software Engineer",
+        mode=InterviewMode.MOCK,
+        total_questions=1
+    )
+    session.add_response(QuestionResponse(
+        question_id="q_0",
+        question_text="Explain how a hash table works",
+        question_type="technical",
+        evaluation_score=80.0
+    ))
+    
+    loaded = InterviewSession.from_json(session.model_dump_json())
+    
+    assert loaded == session
+    assert loaded.mode == InterviewMode.MOCK
+    assert loaded.responses[0].evaluation_score == 80.0
+
+
+def test_calculate_metrics_by_question_type():
+    """Test metrics split scores by question type and ignore skipped questions"""
+    session = InterviewSession(candidate_name="Metrics User", target_role="Software Engineer")
+    for question_type, score, seconds, skipped in [
+        ("technical", 80.0, 120, False),
+        ("coding", 90.0, 300, False),
+        ("behavioral", 70.0, 200, False),
+        ("technical", None, 60, True),
+    ]:
+        session.add_response(QuestionResponse(
+            question_id=f"q_{question_type}",
+            question_text="Question",
+            question_type=question_type,
+            evaluation_score=score,
+            time_spent_seconds=seconds,
+            is_skipped=skipped
+        ))
+    
+    session.calculate_metrics()
+    
+    assert session.average_score == pytest.approx(80.0)
+    assert session.technical_score == pytest.approx(85.0)
+    assert session.behavioral_score == pytest.approx(70.0)
+    assert session.total_duration_seconds == 680
+
+
+def test_question_response_rejects_unknown_type():
+    """Test question types are limited to the generator's question types"""
+    with pytest.raises(ValueError):
+        QuestionResponse(
+            question_id="q_0",
+            question_text="Question",
+            question_type="trivia"
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,32 @@
+"""
+Tests for Validators
+"""
+import pytest
+from src.utils.validators import validate_email, validate_emails
+
+
+def test_validate_emails_matches_validate_email_in_order():
+    """Test batch validation gives one validate_email() result per address, in order"""
+    emails = [
+        "jane.doe@example.com",
+        "not-an-email",
+        "",
+        None,
+        "dev+tag@sub.example.co",
+        "missing@tld",
+    ]
+
+    results = validate_emails(emails)
+
+    assert results == [True, False, False, False, True, False]
+    assert results == [validate_email(email) for email in emails]
+
+
+def test_validate_emails_accepts_any_iterable():
+    """Test a generator works as well as a list, and an empty input gives no results"""
+    assert validate_emails(e for e in ["a@b.io", "bad"]) == [True, False]
+    assert validate_emails([]) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
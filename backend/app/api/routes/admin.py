@@ -2,6 +2,7 @@
 Admin routes for manual user management and system health checks.
 These endpoints should be protected in production with proper authentication.
 """
+import smtplib
 from fastapi import APIRouter, HTTPException, Depends, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
@@ -131,7 +132,6 @@ async def check_smtp_health():
         
         # Try to connect to SMTP server
         try:
-            import smtplib
             with smtplib.SMTP(email_service.smtp_host, email_service.smtp_port, timeout=5) as server:
                 server.starttls()
                 server.login(email_service.smtp_user, email_service.smtp_password)
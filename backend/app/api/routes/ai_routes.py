@@ -9,6 +9,7 @@ This module provides REST API endpoints for AI-powered features:
 """
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
 from typing import Dict, Any
+import os
 import traceback
 
 from app.schemas.ai_schemas import (
@@ -236,7 +237,6 @@ async def ai_health_check(
 
     Returns status and configuration info.
     """
-    import os
     return {
         "status": "healthy",
         "service": "AI/NLP Service",
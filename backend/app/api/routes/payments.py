@@ -4,9 +4,11 @@ Stripe payment and subscription routes.
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Header
 from sqlalchemy.orm import Session
 from typing import Optional
+import json
 import stripe
 from datetime import datetime, timezone, timedelta
 
+from app.core.cache import cache_manager
 from app.core.database import get_db
 from app.core.config import settings
 from app.core.logging import logger
@@ -42,6 +44,15 @@ PLAN_CONFIG = {
     },
 }
 
+# How long a subscription's Stripe status is reused before fetching it again.
+# Webhooks and cancellations clear the entry, so changes still show up at once.
+SUBSCRIPTION_CACHE_TTL = 300
+
+
+def _subscription_cache_key(subscription_id: str) -> str:
+    """Cache key for a subscription's latest Stripe status."""
+    return f"stripe:subscription:{subscription_id}"
+
 
 @router.post("/create-checkout", response_model=CheckoutSessionResponse)
 async def create_checkout_session(
@@ -224,6 +235,7 @@ async def stripe_webhook(
             # Subscription updated (e.g., plan change, renewal)
             subscription = event_data
             customer_id = subscription["customer"]
+            await cache_manager.delete(_subscription_cache_key(subscription["id"]))
             
             user = db.query(User).filter(User.stripe_customer_id == customer_id).first()
             if user:
@@ -238,6 +250,7 @@ async def stripe_webhook(
             # Subscription canceled
             subscription = event_data
             customer_id = subscription["customer"]
+            await cache_manager.delete(_subscription_cache_key(subscription["id"]))
             
             user = db.query(User).filter(User.stripe_customer_id == customer_id).first()
             if user:
@@ -331,17 +344,30 @@ async def get_subscription(
     to ensure data is up-to-date.
     """
     # If user has a Stripe subscription ID, fetch latest status from Stripe
+    # (or from the short-lived cache, to skip the round trip on repeat visits)
     cancel_at_period_end = False
     if current_user.stripe_subscription_id and settings.STRIPE_SECRET_KEY:
+        cache_key = _subscription_cache_key(current_user.stripe_subscription_id)
         try:
-            subscription = stripe.Subscription.retrieve(current_user.stripe_subscription_id)
-            cancel_at_period_end = subscription.cancel_at_period_end
+            cached = await cache_manager.get(cache_key)
+            if cached:
+                stripe_state = json.loads(cached)
+            else:
+                subscription = stripe.Subscription.retrieve(current_user.stripe_subscription_id)
+                stripe_state = {
+                    "status": subscription.status,
+                    "cancel_at_period_end": subscription.cancel_at_period_end,
+                }
+                await cache_manager.setex(
+                    cache_key, SUBSCRIPTION_CACHE_TTL, json.dumps(stripe_state)
+                )
+            cancel_at_period_end = stripe_state["cancel_at_period_end"]
             
             # Update local database if status changed
-            if subscription.status != current_user.subscription_status:
-                current_user.subscription_status = subscription.status
+            if stripe_state["status"] != current_user.subscription_status:
+                current_user.subscription_status = stripe_state["status"]
                 db.commit()
-                logger.info(f"Updated subscription status for user {current_user.id}: {subscription.status}")
+                logger.info(f"Updated subscription status for user {current_user.id}: {stripe_state['status']}")
         except stripe.error.StripeError as e:
             logger.warning(f"Could not fetch subscription from Stripe: {e}")
             # Continue with database values
@@ -394,6 +420,7 @@ async def cancel_subscription(
         # The webhook will update it to "canceled" when period ends
         current_user.subscription_status = subscription.status
         db.commit()
+        await cache_manager.delete(_subscription_cache_key(current_user.stripe_subscription_id))
         
         logger.info(f"Scheduled subscription cancellation for user {current_user.id}")
         
@@ -17,8 +17,9 @@ For production deployment:
 6. Use production API keys
 7. Enable HTTPS
 """
+from functools import cached_property
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import FrozenSet, List
 
 
 class Settings(BaseSettings):
@@ -87,6 +88,8 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: str = ""  # Optional alternative provider
     AI_MODEL: str = "gpt-4"
     AI_TEMPERATURE: float = 0.7
+    AI_MAX_CALLS_PER_MINUTE: int = 60  # Process-wide budget of LLM provider requests
+    AI_RATE_LIMIT_MAX_WAIT: float = 10.0  # Seconds a request may queue before a 429
 
     # Stripe Payment Configuration
     # SECURITY: Use test keys (sk_test_) in development, live keys (sk_live_) in production
@@ -114,10 +117,18 @@ class Settings(BaseSettings):
     AWS_REGION: str = "us-east-1"
     AWS_SES_FROM_EMAIL: str = ""  # Verified sender email in AWS SES
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
+        """CORS origins parsed once; settings do not change after startup"""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
+    @cached_property
+    def allowed_file_types_list(self) -> FrozenSet[str]:
+        """Allowed upload extensions without the dot, parsed once for per-upload membership checks"""
+        return frozenset(
+            ext.strip().lower() for ext in self.ALLOWED_FILE_TYPES.split(",") if ext.strip()
+        )
+
     class Config:
         env_file = ".env"
         extra = "allow"  # Changed from "ignore" to "allow"
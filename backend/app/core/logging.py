@@ -1,15 +1,32 @@
 """
 Logging configuration for the application.
 """
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from pythonjsonlogger import jsonlogger
 from app.core.config import settings
 
 
+class _RecordQueueHandler(QueueHandler):
+    """
+    Queue handler that enqueues records as-is.
+
+    The stock prepare() pre-formats the message and clears args and
+    exc_info, which would leave the JSON file handler without the
+    traceback. The listener runs in this process, so the record can be
+    handed over untouched.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 def setup_logging():
-    """Configure application logging with both console and file handlers."""
+    """Configure application logging with console and file handlers behind a queue."""
     
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
@@ -40,9 +57,16 @@ def setup_logging():
     )
     file_handler.setFormatter(json_formatter)
     
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # Log calls only enqueue the record; a background thread formats it and
+    # does the stdout/file writes, so request handlers never block on I/O
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(_RecordQueueHandler(log_queue))
     
     return logger
 
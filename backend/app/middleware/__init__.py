@@ -1,6 +1,7 @@
 """
 Middleware modules for security and request processing.
 """
+from .body_size import BodySizeLimitMiddleware
 from .rate_limit import RateLimitMiddleware, limiter
 
-__all__ = ["RateLimitMiddleware", "limiter"]
+__all__ = ["BodySizeLimitMiddleware", "RateLimitMiddleware", "limiter"]
@@ -0,0 +1,65 @@
+"""
+Request body size limiting middleware.
+
+Implements OWASP API4:2023 - Unrestricted Resource Consumption:
+- Rejects requests whose declared Content-Length is over the upload limit
+- Responds with 413 before any of the body is read or parsed
+
+Uploads without a Content-Length (chunked transfer) are still capped
+while streaming to disk by save_upload_file.
+"""
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Callable
+
+from app.core.config import settings
+from app.core.logging import logger
+
+# Allowance for multipart boundaries and form fields around the file itself
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class BodySizeLimitMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that rejects oversized request bodies from their headers.
+
+    FastAPI parses multipart forms before route code runs, so a size check
+    inside the handler only happens after the whole upload was received.
+    """
+
+    def __init__(self, app, max_body_size: int = None):
+        super().__init__(app)
+        self.max_body_size = (
+            max_body_size
+            if max_body_size is not None
+            else settings.MAX_FILE_SIZE + MULTIPART_OVERHEAD_BYTES
+        )
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        """
+        Check the declared body size and return 413 if it's over the limit.
+        """
+        content_length = request.headers.get("content-length")
+        if content_length is not None:
+            try:
+                body_size = int(content_length)
+            except ValueError:
+                return JSONResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    content={"detail": "Invalid Content-Length header"},
+                )
+
+            if body_size > self.max_body_size:
+                logger.warning(
+                    f"Rejected request body - size too large: {body_size} bytes "
+                    f"for {request.url.path}"
+                )
+                return JSONResponse(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    content={
+                        "detail": f"Request body exceeds limit of {self.max_body_size} bytes"
+                    },
+                )
+
+        return await call_next(request)
@@ -9,25 +9,41 @@ import os
 import asyncio
 import hashlib
 import json
-from pathlib import Path
-from typing import Dict, List, Any, Optional
+import math
+from typing import Awaitable, Callable, Dict, List, Any, Optional
 from fastapi import UploadFile, HTTPException
 import tempfile
+import traceback
 from app.core.cache import cache_manager
+from app.core.config import settings
+from app.core.logging import logger
 
 # Import PrepWiseAPI correctly
 try:
     from src.api.prepwise_api import PrepWiseAPI
     from src.resume_parser.schemas import ParsedResume
     from src.question_generator.schemas import QuestionSet
+    from src.utils.rate_limiter import RateLimiter, RateLimitExceeded
 except ImportError as e:
-    print(f"ERROR: Cannot import PrepWiseAPI. Make sure ai-engine is installed.")
-    print(f"Run: cd backend && pip install -e ../ai-engine")
+    logger.error("Cannot import PrepWiseAPI. Make sure ai-engine is installed.")
+    logger.error("Run: cd backend && pip install -e ../ai-engine")
     raise ImportError(f"PrepWise AI not installed: {e}")
 
-from app.core.config import settings
-from app.core.logging import logger
 from app.services.dsa_generator import DSAGenerator
+from app.utils.file_utils import UPLOAD_CHUNK_SIZE, validate_file_size
+
+# Resume formats the ai-engine parser can read
+RESUME_FILE_EXTENSIONS = frozenset({".pdf", ".docx"})
+
+
+def _rate_limit_error(exc: RateLimitExceeded) -> HTTPException:
+    """429 response for an AI call the rate limiter turned away."""
+    retry_after = math.ceil(exc.retry_after)
+    return HTTPException(
+        status_code=429,
+        detail=f"AI service is busy. Please retry in {retry_after} seconds.",
+        headers={"Retry-After": str(retry_after)}
+    )
 
 
 class AIService:
@@ -38,6 +54,9 @@ class AIService:
     async-compatible methods for the FastAPI backend.
     """
 
+    # Upper bound on answers evaluated at once for a single interview
+    MAX_CONCURRENT_EVALUATIONS = 5
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize AI Service.
@@ -49,8 +68,23 @@ class AIService:
             self.ai = PrepWiseAPI()
             logger.info("✅ PrepWise AI initialized successfully")
 
-            # Initialize DSA generator
-            self.dsa_generator = DSAGenerator()
+            # One budget for every request the LLM clients send to the provider
+            # (resume parsing, questions, evaluation and DSA generation alike)
+            self._ai_rate_limiter = RateLimiter(
+                settings.AI_MAX_CALLS_PER_MINUTE,
+                max_wait=settings.AI_RATE_LIMIT_MAX_WAIT
+            )
+            self.ai.resume_parser.llm_client.rate_limiter = self._ai_rate_limiter
+            self.ai.question_generator.llm_client.rate_limiter = self._ai_rate_limiter
+
+            # Running parse/evaluate jobs by content hash, shared by duplicates
+            self._inflight: Dict[str, asyncio.Future] = {}
+
+            # Initialize DSA generator on the PrepWise AI client so both share
+            # one connection pool
+            self.dsa_generator = DSAGenerator(
+                llm_client=self.ai.question_generator.llm_client
+            )
             logger.info("✅ DSA Generator initialized")
 
             # Verify API key is configured
@@ -64,6 +98,62 @@ class AIService:
             logger.error(f"❌ Failed to initialize PrepWise AI: {e}")
             raise RuntimeError(f"PrepWise AI initialization failed: {e}")
 
+    async def warm_up(self) -> None:
+        """
+        Pre-open the connection to the LLM provider.
+
+        Called once at startup so the first real request doesn't pay the
+        TLS handshake. Best effort: failures only get logged.
+        """
+        llm_client = self.ai.question_generator.llm_client
+        if await asyncio.to_thread(llm_client.warm_up):
+            logger.info("✅ LLM provider connection warmed up")
+        else:
+            logger.warning("⚠️  Could not warm up LLM provider connection")
+
+    async def _run_ai(self, func, *args, **kwargs):
+        """
+        Run a blocking ai-engine call in a worker thread.
+
+        Fails fast with RateLimitExceeded when the provider budget is already
+        used up; otherwise each LLM request inside func waits for its own slot.
+
+        Args:
+            func: PrepWise API method to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        self._ai_rate_limiter.check()
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def _run_once(self, key: str, work: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run work once for all concurrent callers with the same key.
+
+        The first caller starts the job; callers arriving while it runs
+        await the same result (or exception) instead of repeating the LLM
+        call. The job is shielded, so a caller that disconnects doesn't
+        cancel it for the others.
+
+        Args:
+            key: Content-hash key identifying the job
+            work: Zero-argument coroutine function doing the job
+
+        Returns:
+            The job's result
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(work())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info(f"♻️  Joining in-flight AI job (key: {key[:24]})")
+        return await asyncio.shield(task)
+
     async def parse_resume_from_upload(self, file: UploadFile) -> Dict[str, Any]:
         """
         Parse resume from uploaded file with Redis caching for 99% faster duplicate uploads.
@@ -75,54 +165,80 @@ class AIService:
             Parsed resume data
 
         Raises:
-            HTTPException: If file type is invalid or parsing fails
+            HTTPException: If file type is invalid, the file is too large or parsing fails
         """
         # Validate file type
         if not file.filename:
             raise HTTPException(status_code=400, detail="File must have a filename")
 
-        file_ext = Path(file.filename).suffix.lower()
-        if file_ext not in ['.pdf', '.docx']:
+        file_ext = os.path.splitext(file.filename)[1].lower()
+        if file_ext not in RESUME_FILE_EXTENSIONS:
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid file type: {file_ext}. Only PDF and DOCX are supported."
             )
 
-        # Read file content
-        content = await file.read()
-
-        # Check cache using file hash (saves 5-10 seconds for duplicate uploads)
-        file_hash = hashlib.sha256(content).hexdigest()
-        cache_key = f"resume:hash:{file_hash}"
-
-        cached_result = await cache_manager.get(cache_key)
-        if cached_result:
-            logger.info(f"✅ Cache HIT for resume {file.filename} (hash: {file_hash[:8]})")
-            return json.loads(cached_result)
-
-        logger.info(f"⚠️  Cache MISS for resume {file.filename} - parsing with AI...")
-
-        # Save uploaded file temporarily
+        # Stream the upload to a temp file, hashing it on the way, instead of
+        # buffering the whole resume in memory
         temp_path = None
         try:
+            file_hasher = hashlib.sha256()
+            file_size = 0
             with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
                 temp_path = temp_file.name
-                temp_file.write(content)
-
-            # Parse resume with AI (expensive operation)
-            logger.info(f"Parsing resume: {file.filename}")
-            parsed_resume = self.ai.parse_resume(temp_path)
-            logger.info(f"Successfully parsed resume: {file.filename}")
-
-            # Convert ParsedResume object to dict
-            result = parsed_resume.model_dump()
-
-            # Cache result for 1 hour (3600 seconds)
-            await cache_manager.setex(cache_key, 3600, json.dumps(result))
-            logger.info(f"💾 Cached resume parsing result (hash: {file_hash[:8]})")
-
-            return result
-
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    # Plain byte count against the byte limit, checked per chunk
+                    file_size += len(chunk)
+                    if not validate_file_size(file_size):
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"File size exceeds limit of {settings.MAX_FILE_SIZE} bytes"
+                        )
+                    file_hasher.update(chunk)
+                    temp_file.write(chunk)
+
+            # Check cache using file hash (saves 5-10 seconds for duplicate uploads)
+            file_hash = file_hasher.hexdigest()
+            cache_key = f"resume:hash:{file_hash}"
+
+            cached_result = await cache_manager.get(cache_key)
+            if cached_result:
+                logger.info(f"✅ Cache HIT for resume {file.filename} (hash: {file_hash[:8]})")
+                return json.loads(cached_result)
+
+            logger.info(f"⚠️  Cache MISS for resume {file.filename} - parsing with AI...")
+
+            resume_path = temp_path
+
+            async def parse_and_cache() -> Dict[str, Any]:
+                try:
+                    # Parse resume with AI (expensive operation)
+                    logger.info(f"Parsing resume: {file.filename}")
+                    parsed_resume = await self._run_ai(self.ai.parse_resume, resume_path)
+                    logger.info(f"Successfully parsed resume: {file.filename}")
+                finally:
+                    # The job owns this temp file once started
+                    if os.path.exists(resume_path):
+                        os.unlink(resume_path)
+
+                # Convert ParsedResume object to dict
+                result = parsed_resume.model_dump()
+
+                # Cache result for 1 hour (3600 seconds)
+                await cache_manager.setex(cache_key, 3600, json.dumps(result))
+                logger.info(f"💾 Cached resume parsing result (hash: {file_hash[:8]})")
+                return result
+
+            # Identical resumes uploaded at the same time share one parse; a
+            # new job takes over cleanup of this upload's temp file
+            if cache_key not in self._inflight:
+                temp_path = None
+            return await self._run_once(cache_key, parse_and_cache)
+
+        except HTTPException:
+            raise
+        except RateLimitExceeded as e:
+            raise _rate_limit_error(e)
         except Exception as e:
             logger.error(f"Error parsing resume: {str(e)}")
             raise HTTPException(
@@ -272,6 +388,7 @@ class AIService:
                 difficulty = difficulty_map.get(experience_level, "medium")
 
                 # Generate DSA questions
+                self._ai_rate_limiter.check()
                 dsa_questions = await self.dsa_generator.generate_dsa_question(
                     difficulty=difficulty,
                     topic=None,  # Let AI choose topic
@@ -327,9 +444,12 @@ class AIService:
                 # Adjust technical count if we already generated DSA questions
                 remaining_technical = 0 if use_dsa_questions else num_technical
 
-                # Call PrepWise API with validated parameters
+                # Call PrepWise API with validated parameters. The ai-engine is
+                # synchronous, so run it in a worker thread to keep the event
+                # loop free for other requests.
                 try:
-                    question_set = self.ai.generate_questions(
+                    question_set = await self._run_ai(
+                        self.ai.generate_questions,
                         target_role=target_role,
                         experience_level=mapped_level,
                         num_technical=remaining_technical,
@@ -338,11 +458,14 @@ class AIService:
                         resume_data=resume_obj,
                         target_company=company
                     )
+                except RateLimitExceeded:
+                    raise
                 except Exception as api_error:
                     logger.error(f"❌ PrepWise API error: {str(api_error)}")
                     # If API call fails, try with minimal parameters
                     logger.info(f"🔄 Retrying with minimal parameters...")
-                    question_set = self.ai.generate_questions(
+                    question_set = await self._run_ai(
+                        self.ai.generate_questions,
                         target_role="Software Engineer",
                         experience_level=mapped_level,
                         num_technical=remaining_technical,
@@ -367,9 +490,12 @@ class AIService:
 
             return questions
 
+        except HTTPException:
+            raise
+        except RateLimitExceeded as e:
+            raise _rate_limit_error(e)
         except Exception as e:
             logger.error(f"❌ Question generation error: {str(e)}")
-            import traceback
             logger.error(f"Full traceback: {traceback.format_exc()}")
             raise HTTPException(
                 status_code=500,
@@ -397,32 +523,65 @@ class AIService:
             # Extract question text
             question_text = question.get("question") or question.get("text") or str(question)
 
-            logger.info(f"Evaluating response for question: {question_text[:50]}...")
+            # Identical resubmissions (replays, frontend retries) reuse the
+            # cached evaluation instead of paying for another LLM call
+            eval_type = question_type or "technical"
+            expected_points = question.get("expected_points")
+            eval_hash = hashlib.sha256(
+                json.dumps(
+                    [question_text, transcript, eval_type, expected_points],
+                    default=str
+                ).encode("utf-8")
+            ).hexdigest()
+            cache_key = f"evaluation:hash:{eval_hash}"
+
+            cached_result = await cache_manager.get(cache_key)
+            if cached_result:
+                logger.info(f"✅ Cache HIT for evaluation (hash: {eval_hash[:8]})")
+                return json.loads(cached_result)
+
+            async def evaluate_and_cache() -> Dict[str, Any]:
+                logger.info(f"Evaluating response for question: {question_text[:50]}...")
+
+                # Use PrepWiseAPI's evaluate_answer method in a worker thread, so
+                # concurrent evaluations really overlap instead of blocking the loop
+                evaluation = await self._run_ai(
+                    self.ai.evaluate_answer,
+                    question=question_text,
+                    answer=transcript,
+                    question_type=eval_type,
+                    expected_points=expected_points
+                )
+
+                # Convert AnswerEvaluation to dict format expected by backend
+                evaluation_dict = {
+                    "score": evaluation.overall_score,
+                    "score_level": evaluation.score_level.value,
+                    "strengths": [item.message for item in evaluation.strengths],
+                    "weaknesses": [item.message for item in evaluation.weaknesses],
+                    "feedback": evaluation.summary or "",
+                    "suggestions": [item.message for item in evaluation.suggestions],
+                    "criterion_scores": [cs.model_dump() for cs in evaluation.criterion_scores],
+                    "key_takeaways": evaluation.key_takeaways,
+                    "improvement_areas": evaluation.improvement_areas,
+                }
 
-            # Use PrepWiseAPI's evaluate_answer method
-            evaluation = self.ai.evaluate_answer(
-                question=question_text,
-                answer=transcript,
-                question_type=question_type or "technical",
-                expected_points=question.get("expected_points")
-            )
+                # Cache result for 1 hour (3600 seconds); a rule-based fallback
+                # from a failed LLM call is served once but not cached, so the
+                # next submission gets a real evaluation
+                if not evaluation.is_fallback:
+                    await cache_manager.setex(cache_key, 3600, json.dumps(evaluation_dict))
 
-            # Convert AnswerEvaluation to dict format expected by backend
-            evaluation_dict = {
-                "score": evaluation.overall_score,
-                "score_level": evaluation.score_level.value,
-                "strengths": [item.message for item in evaluation.strengths],
-                "weaknesses": [item.message for item in evaluation.weaknesses],
-                "feedback": evaluation.summary or "",
-                "suggestions": [item.message for item in evaluation.suggestions],
-                "criterion_scores": [cs.model_dump() for cs in evaluation.criterion_scores],
-                "key_takeaways": evaluation.key_takeaways,
-                "improvement_areas": evaluation.improvement_areas,
-            }
+                logger.info(f"Response evaluated - Score: {evaluation.overall_score}")
+                return evaluation_dict
 
-            logger.info(f"Response evaluated - Score: {evaluation.overall_score}")
-            return evaluation_dict
+            # The same answer submitted twice at once shares one evaluation
+            return await self._run_once(cache_key, evaluate_and_cache)
 
+        except HTTPException:
+            raise
+        except RateLimitExceeded as e:
+            raise _rate_limit_error(e)
         except Exception as e:
             logger.error(f"Error evaluating response: {str(e)}")
             raise HTTPException(
@@ -450,7 +609,15 @@ class AIService:
                 f"Evaluating full interview with {len(questions_and_responses)} Q&A pairs"
             )
 
-            # Evaluate each question-response pair IN PARALLEL for much faster performance
+            # Evaluate each question-response pair IN PARALLEL for much faster performance.
+            # The semaphore keeps a long interview from flooding the worker
+            # threads and the provider's rate limit with every answer at once.
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_EVALUATIONS)
+
+            async def evaluate_limited(**kwargs) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.evaluate_response(**kwargs)
+
             # Create evaluation tasks for all Q&A pairs
             evaluation_tasks = []
             q_types = []
@@ -461,7 +628,7 @@ class AIService:
                 q_types.append(q_type)
 
                 # Create async task (don't await yet)
-                task = self.evaluate_response(
+                task = evaluate_limited(
                     question=question,
                     transcript=response,
                     question_type=q_type
@@ -469,7 +636,7 @@ class AIService:
                 evaluation_tasks.append(task)
 
             # Execute all evaluations in parallel using asyncio.gather()
-            # This reduces evaluation time from N×10s to ~10s for any N questions
+            # This reduces evaluation time from N×10s to ~ceil(N/5)×10s
             logger.info(f"Starting parallel evaluation of {len(evaluation_tasks)} questions...")
             individual_evaluations = await asyncio.gather(*evaluation_tasks)
             logger.info("Parallel evaluation completed!")
@@ -524,6 +691,10 @@ class AIService:
             )
             return report
 
+        except HTTPException:
+            raise
+        except RateLimitExceeded as e:
+            raise _rate_limit_error(e)
         except Exception as e:
             logger.error(f"Error evaluating interview: {str(e)}")
             raise HTTPException(
@@ -4,15 +4,25 @@ DSA Question Generator Service
 Generates LeetCode-style coding problems using AI based on difficulty and topic.
 """
 import json
+import os
+import random
+from functools import cached_property
 from typing import Dict, List, Optional, Any
 from app.core.logging import logger
 
 # Import LLM client from ai-engine
 try:
     from src.utils.llm_client import LLMClient
+    from src.utils.rate_limiter import RateLimitExceeded
 except ImportError:
     # Fallback if import fails
     LLMClient = None
+    RateLimitExceeded = ()  # An empty tuple matches no exception
+
+try:
+    from openai import AsyncOpenAI
+except ImportError:
+    AsyncOpenAI = None
 
 
 class DSAGenerator:
@@ -40,9 +50,17 @@ class DSAGenerator:
     
     ALL_TOPICS = CORE_DATA_STRUCTURES + ALGORITHMS_TECHNIQUES
     
-    def __init__(self):
+    def __init__(self, llm_client: Optional["LLMClient"] = None):
+        """
+        Initialize the DSA generator.
+
+        Args:
+            llm_client: Existing LLM client to reuse (a new one is created if not provided)
+        """
         # Initialize LLM client for direct question generation
-        if LLMClient:
+        if llm_client:
+            self.llm_client = llm_client
+        elif LLMClient:
             self.llm_client = LLMClient()
         else:
             self.llm_client = None
@@ -68,7 +86,6 @@ class DSAGenerator:
         try:
             # Select topic if not provided
             if not topic:
-                import random
                 topic = random.choice(self.ALL_TOPICS)
             
             logger.info(f"Generating {num_questions} DSA question(s) - Difficulty: {difficulty}, Topic: {topic}")
@@ -167,18 +184,14 @@ Example format:
             if self.llm_client:
                 system_prompt = "You are an expert at creating LeetCode-style coding problems. Always return valid JSON only, no markdown, no code blocks. Return a JSON array of question objects."
                 
-                # Generate using LLM client (synchronous, but we're in async context)
-                import asyncio
-                loop = asyncio.get_event_loop()
-                response_text = await loop.run_in_executor(
-                    None,
-                    lambda: self.llm_client.generate(
-                        prompt=prompt,
-                        system_prompt=system_prompt,
-                        json_mode=True,
-                        temperature=0.7,
-                        max_tokens=3000
-                    )
+                # Await the LLM client's async API directly on the event loop
+                # instead of tying up an executor thread for the whole call
+                response_text = await self.llm_client.generate_async(
+                    prompt=prompt,
+                    system_prompt=system_prompt,
+                    json_mode=True,
+                    temperature=0.7,
+                    max_tokens=3000
                 )
             else:
                 # Fallback to direct OpenAI call
@@ -210,23 +223,29 @@ Example format:
                 # Return a fallback question
                 return [self._get_fallback_question()]
                 
+        except RateLimitExceeded:
+            # Let the caller answer 429 instead of serving a canned question
+            raise
         except Exception as e:
             logger.error(f"Error in AI generation: {e}")
             return [self._get_fallback_question()]
     
+    @cached_property
+    def _openai_client(self) -> "AsyncOpenAI":
+        """OpenAI client for the fallback path, built on first use and then reused."""
+        if AsyncOpenAI is None:
+            raise ImportError("openai package not installed")
+
+        api_key = os.getenv('OPENAI_API_KEY')
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY not set")
+
+        return AsyncOpenAI(api_key=api_key)
+
     async def _call_openai_direct(self, prompt: str) -> str:
         """Call OpenAI directly to generate DSA questions (fallback method)."""
         try:
-            from openai import AsyncOpenAI
-            import os
-            
-            api_key = os.getenv('OPENAI_API_KEY')
-            if not api_key:
-                raise ValueError("OPENAI_API_KEY not set")
-            
-            client = AsyncOpenAI(api_key=api_key)
-            
-            response = await client.chat.completions.create(
+            response = await self._openai_client.chat.completions.create(
                 model="gpt-4",
                 messages=[
                     {
@@ -3,6 +3,7 @@ Email service for sending verification emails and other notifications.
 """
 import smtplib
 import secrets
+import traceback
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta, timezone
@@ -209,7 +210,6 @@ class EmailService:
             return False
         except Exception as e:
             logger.error(f"Failed to send verification email to {email}: {type(e).__name__}: {e}")
-            import traceback
             logger.error(f"Full traceback: {traceback.format_exc()}")
             return False
     
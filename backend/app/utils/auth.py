@@ -1,6 +1,7 @@
 """
 Authentication utilities for user management.
 """
+import logging
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import JWTError, jwt
@@ -29,7 +30,6 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
             
         return bcrypt.checkpw(plain_password, hashed_password)
     except Exception as e:
-        import logging
         logging.error(f"Password verification error: {e}")
         return False
 
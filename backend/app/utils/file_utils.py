@@ -13,11 +13,18 @@ import os
 import uuid
 from pathlib import Path
 from typing import Optional, Tuple
+import aiofiles
 from fastapi import UploadFile, HTTPException
 from app.core.config import settings
 from app.core.logging import logger
 import re
 
+# Office formats stored as ZIP archives
+ZIP_BASED_EXTENSIONS = frozenset({'.docx', '.xlsx', '.pptx'})
+
+# Uploads are copied to disk in pieces of this size instead of read whole
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -103,7 +110,7 @@ def validate_file_type(filename: str) -> bool:
     Returns:
         bool: True if file type is allowed
     """
-    file_extension = Path(filename).suffix.lower().lstrip('.')
+    file_extension = os.path.splitext(filename)[1].lower().lstrip('.')
     return file_extension in settings.allowed_file_types_list
 
 
@@ -137,14 +144,14 @@ def validate_file_content(content: bytes, filename: str) -> bool:
     if len(content) < 4:
         return False
 
-    file_extension = Path(filename).suffix.lower()
+    file_extension = os.path.splitext(filename)[1].lower()
 
     # PDF signature
     if file_extension == '.pdf':
         return content[:4] == b'%PDF'
 
     # DOCX signature (ZIP format)
-    if file_extension in ['.docx', '.xlsx', '.pptx']:
+    if file_extension in ZIP_BASED_EXTENSIONS:
         return content[:2] == b'PK'  # ZIP signature
 
     # DOC signature (older Word format)
@@ -168,6 +175,24 @@ def validate_file_content(content: bytes, filename: str) -> bool:
     return True
 
 
+def _ensure_upload_dir(safe_subdir: str) -> Path:
+    """
+    Create an upload subdirectory if it is missing.
+    
+    Runs on every upload rather than once per process, so a subdirectory
+    removed by a cleanup job or a volume remount is simply re-created.
+    
+    Args:
+        safe_subdir: Sanitized subdirectory name within the uploads folder
+    
+    Returns:
+        Path: Resolved path of the subdirectory
+    """
+    upload_dir = Path(settings.UPLOAD_DIR) / safe_subdir
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    return upload_dir.resolve()
+
+
 async def save_upload_file(
     file: UploadFile,
     subdirectory: str,
@@ -178,7 +203,7 @@ async def save_upload_file(
 
     SECURITY CHECKS:
     1. File type validation (whitelist)
-    2. File size validation
+    2. File size validation (enforced while streaming to disk)
     3. Filename sanitization (prevent path traversal)
     4. Content-type validation
     5. Magic number verification (prevent disguised malicious files)
@@ -208,22 +233,13 @@ async def save_upload_file(
         logger.warning(f"Rejected file upload - invalid type: {file.filename}")
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file type. Allowed types: {settings.allowed_file_types_list}"
-        )
-
-    # SECURITY: Read file content to check size and validate content
-    content = await file.read()
-    file_size = len(content)
-
-    if not validate_file_size(file_size):
-        logger.warning(f"Rejected file upload - size too large: {file_size} bytes")
-        raise HTTPException(
-            status_code=413,  # Payload Too Large
-            detail=f"File size ({file_size} bytes) exceeds limit of {settings.MAX_FILE_SIZE} bytes"
+            detail=f"Invalid file type. Allowed types: {', '.join(sorted(settings.allowed_file_types_list))}"
         )
 
-    # SECURITY: Validate file content matches extension (magic number check)
-    if not validate_file_content(content, safe_filename):
+    # SECURITY: Validate file content matches extension (magic number check).
+    # Only the first chunk is needed; the rest is streamed to disk below.
+    first_chunk = await file.read(UPLOAD_CHUNK_SIZE)
+    if not validate_file_content(first_chunk, safe_filename):
         logger.warning(f"Rejected file upload - content mismatch: {file.filename}")
         raise HTTPException(
             status_code=400,
@@ -237,14 +253,13 @@ async def save_upload_file(
     safe_subdir = re.sub(r'[^a-zA-Z0-9_-]', '_', subdirectory)
 
     # Create full path
-    upload_dir = Path(settings.UPLOAD_DIR) / safe_subdir
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    upload_dir = _ensure_upload_dir(safe_subdir)
     file_path = upload_dir / unique_filename
 
     # SECURITY: Verify final path is within upload directory (prevent path traversal)
     try:
         final_path = file_path.resolve()
-        upload_base = upload_dir.resolve()
+        upload_base = upload_dir
         if not str(final_path).startswith(str(upload_base)):
             logger.error(f"Path traversal attempt detected: {file_path}")
             raise HTTPException(
@@ -255,10 +270,22 @@ async def save_upload_file(
         logger.error(f"Path validation error: {e}")
         raise HTTPException(status_code=400, detail="Invalid file path")
 
-    # Save file with restricted permissions
+    # Stream to disk with restricted permissions, enforcing the size limit
+    # as chunks arrive so an oversized upload is never held in memory
+    file_size = 0
     try:
-        with open(file_path, "wb") as buffer:
-            buffer.write(content)
+        async with aiofiles.open(file_path, "wb") as buffer:
+            chunk = first_chunk
+            while chunk:
+                file_size += len(chunk)
+                if not validate_file_size(file_size):
+                    logger.warning(f"Rejected file upload - size too large: over {settings.MAX_FILE_SIZE} bytes")
+                    raise HTTPException(
+                        status_code=413,  # Payload Too Large
+                        detail=f"File size exceeds limit of {settings.MAX_FILE_SIZE} bytes"
+                    )
+                await buffer.write(chunk)
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
 
         # SECURITY: Set restrictive file permissions (owner read/write only)
         os.chmod(file_path, 0o600)
@@ -266,7 +293,6 @@ async def save_upload_file(
         logger.info(f"File saved securely: {file_path} ({file_size} bytes)")
         return str(file_path), unique_filename
     except Exception as e:
-        logger.error(f"Error saving file: {e}")
         # Clean up partial file if exists
         if file_path.exists():
             try:
@@ -274,6 +300,9 @@ async def save_upload_file(
             except Exception:
                 # Ignore errors during cleanup, file may already be deleted
                 pass
+        if isinstance(e, HTTPException):
+            raise
+        logger.error(f"Error saving file: {e}")
         raise HTTPException(status_code=500, detail="Error saving file")
 
 
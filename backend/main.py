@@ -8,8 +8,11 @@ SECURITY FEATURES:
 - JWT authentication with secure token handling
 - Security headers for XSS/clickjacking prevention
 """
+import asyncio
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from app.core.config import settings
 from app.core.logging import logger
@@ -18,6 +21,7 @@ from app.utils.error_handlers import prepwise_exception_handler, general_excepti
 from app.api import api_router
 from app.core.cache import cache_manager
 from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.body_size import BodySizeLimitMiddleware
 from contextlib import asynccontextmanager
 
 
@@ -39,11 +43,13 @@ async def lifespan(app: FastAPI):
 
     # Verify PrepWise AI is available
     try:
-        from app.services.ai_service import AIService
+        from app.services.ai_service import get_ai_service
         logger.info("✅ PrepWise AI module loaded successfully")
-        # Try to initialize AI service
-        test_service = AIService()
+        # Build the shared AI service now so the first request doesn't pay for it
+        ai_service = get_ai_service()
         logger.info("✅ AIService initialized successfully")
+        # Open the LLM provider connection in the background without delaying startup
+        app.state.ai_warm_up = asyncio.create_task(ai_service.warm_up())
     except Exception as e:
         logger.error(f"❌ Failed to initialize AIService: {e}")
         logger.error("⚠️  AI features may not work properly")
@@ -53,6 +59,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info(f"Shutting down {settings.APP_NAME} API")
+    warm_up = getattr(app.state, "ai_warm_up", None)
+    if warm_up is not None and not warm_up.done():
+        warm_up.cancel()
     await cache_manager.close()
 
 
@@ -66,6 +75,8 @@ app = FastAPI(
     redoc_url=f"/api/{settings.API_VERSION}/redoc",
     openapi_url=f"/api/{settings.API_VERSION}/openapi.json",
     lifespan=lifespan,
+    # Serialize responses with orjson; transcripts and evaluation reports are large
+    default_response_class=ORJSONResponse,
 )
 
 # ============================================================================
@@ -76,6 +87,10 @@ app = FastAPI(
 # Implements OWASP API4:2023 - Unrestricted Resource Consumption
 app.add_middleware(RateLimitMiddleware)
 
+# 1b. Body Size Limit - reject oversized uploads from Content-Length alone
+# Registered after rate limiting so it runs first and no body is read
+app.add_middleware(BodySizeLimitMiddleware)
+
 # 2. CORS Configuration - Restrict origins in production
 # SECURITY NOTE: "*" allows all origins - only use in development
 # In production, explicitly list allowed origins in CORS_ORIGINS env variable
@@ -88,8 +103,12 @@ app.add_middleware(
     allow_origins=cors_origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],  # Explicit methods only
-    allow_headers=["*"],
+    # Explicit headers only: the frontend sends Authorization and Content-Type.
+    # A fixed list lets the preflight response be built once instead of
+    # echoing each request's headers back.
+    allow_headers=["Authorization", "Content-Type"],
     expose_headers=["X-RateLimit-Limit", "X-RateLimit-Window"],
+    max_age=3600,  # Let browsers cache preflight results for an hour
 )
 
 # 3. Trusted Host Middleware - Prevent Host Header attacks
@@ -100,6 +119,10 @@ if settings.ENVIRONMENT == "production" and settings.TRUSTED_HOSTS:
         allowed_hosts=settings.TRUSTED_HOSTS.split(",")
     )
 
+# 4. GZip Compression - evaluation reports and question sets are large,
+# repetitive JSON; small responses are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Add exception handlers
 app.add_exception_handler(PrepWiseException, prepwise_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
@@ -108,6 +131,27 @@ app.add_exception_handler(Exception, general_exception_handler)
 app.include_router(api_router, prefix=f"/api/{settings.API_VERSION}")
 
 
+# Settings don't change while the process runs, so the health and root
+# payloads are built and JSON-encoded once here rather than on every call
+HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "app": settings.APP_NAME,
+    "version": settings.API_VERSION,
+    "environment": settings.ENVIRONMENT,
+}
+
+ROOT_PAYLOAD = {
+    "message": f"Welcome to {settings.APP_NAME} API",
+    "version": settings.API_VERSION,
+    "docs": f"/api/{settings.API_VERSION}/docs",
+    "redoc": f"/api/{settings.API_VERSION}/redoc",
+    "health": "/health",
+}
+
+HEALTH_BODY = ORJSONResponse(HEALTH_PAYLOAD).body
+ROOT_BODY = ORJSONResponse(ROOT_PAYLOAD).body
+
+
 # Health check endpoint
 @app.get("/health", tags=["Health"])
 async def health_check():
@@ -115,14 +159,9 @@ async def health_check():
     Health check endpoint to verify the API is running.
     
     Returns:
-        dict: Status and application information
+        Response: Pre-encoded JSON with status and application information
     """
-    return {
-        "status": "healthy",
-        "app": settings.APP_NAME,
-        "version": settings.API_VERSION,
-        "environment": settings.ENVIRONMENT,
-    }
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 # ============================================================================
@@ -190,23 +229,25 @@ async def root():
     Root endpoint with API information.
 
     Returns:
-        dict: Welcome message and documentation links
+        Response: Pre-encoded JSON with welcome message and documentation links
     """
-    return {
-        "message": f"Welcome to {settings.APP_NAME} API",
-        "version": settings.API_VERSION,
-        "docs": f"/api/{settings.API_VERSION}/docs",
-        "redoc": f"/api/{settings.API_VERSION}/redoc",
-        "health": "/health",
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
+
+    # Auto-reload runs a file-watching supervisor with a single worker, so
+    # only use it for local development, never when DEBUG leaks into a deployment
+    reload = settings.DEBUG and settings.ENVIRONMENT == "development"
     uvicorn.run(
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG,
-        workers=settings.WORKERS,
+        reload=reload,
+        workers=1 if reload else settings.WORKERS,
+        # uvloop and httptools from uvicorn[standard] when installed,
+        # falling back to asyncio and h11 where they aren't (e.g. Windows)
+        loop="auto",
+        http="auto",
     )
\ No newline at end of file
@@ -3,12 +3,20 @@
 Test script for new email verification features.
 Tests admin endpoints and email status in registration.
 """
+import argparse
+import random
 import requests
 import json
 import sys
 
 BASE_URL = "http://localhost:8000/api/v1"
 
+# Manual script run against live services; keep pytest from collecting it
+__test__ = False
+
+# One session for every check, so they reuse a kept-alive connection
+SESSION = requests.Session()
+
 def print_section(title):
     print(f"\n{'='*60}")
     print(f"  {title}")
@@ -27,7 +35,7 @@ def test_smtp_health():
     """Test SMTP health check endpoint."""
     print_section("1. Testing SMTP Health Check")
     try:
-        response = requests.get(f"{BASE_URL}/admin/smtp-health")
+        response = SESSION.get(f"{BASE_URL}/admin/smtp-health")
         if response.status_code == 200:
             data = response.json()
             print_success(f"SMTP Health Check Response:")
@@ -49,7 +57,7 @@ def test_list_unverified_users():
     """Test listing unverified users."""
     print_section("2. Testing List Unverified Users")
     try:
-        response = requests.get(f"{BASE_URL}/admin/unverified-users")
+        response = SESSION.get(f"{BASE_URL}/admin/unverified-users")
         if response.status_code == 200:
             users = response.json()
             print_success(f"Found {len(users)} unverified user(s)")
@@ -69,7 +77,7 @@ def test_get_user(email):
     """Test getting user by email."""
     print_section(f"3. Testing Get User: {email}")
     try:
-        response = requests.get(f"{BASE_URL}/admin/user/{email}")
+        response = SESSION.get(f"{BASE_URL}/admin/user/{email}")
         if response.status_code == 200:
             user = response.json()
             print_success(f"User found: {user.get('email')}")
@@ -91,10 +99,9 @@ def test_manual_verify(email):
     """Test manually verifying a user."""
     print_section(f"4. Testing Manual Verification: {email}")
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/admin/verify-user",
-            json={"email": email},
-            headers={"Content-Type": "application/json"}
+            json={"email": email}
         )
         if response.status_code == 200:
             data = response.json()
@@ -114,20 +121,18 @@ def test_manual_verify(email):
 def test_registration_with_email_status():
     """Test registration returns email_sent status."""
     print_section("5. Testing Registration Email Status")
-    import random
     test_email = f"test_{random.randint(1000, 9999)}@example.com"
     test_name = "Test User"
     test_password = "TestPassword123"
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/auth/register",
             json={
                 "email": test_email,
                 "name": test_name,
                 "password": test_password
-            },
-            headers={"Content-Type": "application/json"}
+            }
         )
         if response.status_code == 201:
             user = response.json()
@@ -150,7 +155,7 @@ def test_registration_with_email_status():
         print_error(f"Failed to test registration: {e}")
         return False
 
-def main():
+def main(get_user_email=None, verify_email=None):
     print("\n" + "="*60)
     print("  EMAIL VERIFICATION FEATURES TEST")
     print("="*60)
@@ -165,13 +170,11 @@ def main():
     # Test 2: List Unverified Users
     results['list_unverified'] = test_list_unverified_users()
     
-    # Test 3: Get User (test with a known email or skip)
-    test_email = input("\nEnter an email to test get-user endpoint (or press Enter to skip): ").strip()
-    if test_email:
-        results['get_user'] = test_get_user(test_email)
+    # Test 3: Get User (only with --get-user)
+    if get_user_email:
+        results['get_user'] = test_get_user(get_user_email)
     
-    # Test 4: Manual Verification (optional)
-    verify_email = input("\nEnter an email to manually verify (or press Enter to skip): ").strip()
+    # Test 4: Manual Verification (only with --verify)
     if verify_email:
         results['manual_verify'] = test_manual_verify(verify_email)
     
@@ -189,8 +192,15 @@ def main():
     print("="*60)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--get-user", metavar="EMAIL", help="also look up this user")
+    parser.add_argument("--verify", metavar="EMAIL", help="also manually verify this user")
+    args = parser.parse_args()
+
     try:
-        main()
+        # Close the shared session's pooled connection once the run ends
+        with SESSION:
+            main(get_user_email=args.get_user, verify_email=args.verify)
     except KeyboardInterrupt:
         print("\n\nTest interrupted by user")
         sys.exit(1)
@@ -1,6 +1,7 @@
 """
 Test script to send a password reset email and verify it works.
 """
+import argparse
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -8,16 +9,22 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from app.services.email_service import get_email_service
 from app.core.logging import logger
 
-def test_password_reset_email():
+# Manual script run against live services; keep pytest from collecting it
+__test__ = False
+
+def test_password_reset_email(test_email):
     """Test sending a password reset email."""
     print("=" * 60)
     print("Testing Password Reset Email")
     print("=" * 60)
     
     email_service = get_email_service()
+
+    # Nothing can be sent without credentials, so stop before trying
+    if not (email_service.use_ses or (email_service.smtp_user and email_service.smtp_password)):
+        print("\n⚠️  No email credentials configured (AWS SES or SMTP_USER/SMTP_PASSWORD). Skipping.")
+        return
     
-    # Test email (use your actual email)
-    test_email = input("Enter your email address to test: ").strip()
     test_name = "Test User"
     test_token = email_service.generate_verification_token()
     
@@ -47,4 +54,7 @@ def test_password_reset_email():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    test_password_reset_email()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("email", help="address to send the test email to (use your actual email)")
+    args = parser.parse_args()
+    test_password_reset_email(args.email.strip())
@@ -0,0 +1,75 @@
+"""
+Tests that LLM requests turned away by the rate limiter reach clients as 429s
+"""
+import asyncio
+import io
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("pydantic_settings")
+
+from docx import Document
+from fastapi import HTTPException, UploadFile
+
+from app.services.ai_service import AIService
+from src.utils.rate_limiter import RateLimiter
+
+
+def _exhausted_limiter() -> RateLimiter:
+    """Limiter with its only slot taken and no allowance to wait for the next"""
+    rate_limiter = RateLimiter(1, max_wait=0)
+    rate_limiter.reserve()
+    return rate_limiter
+
+
+@pytest.fixture
+def ai_service(monkeypatch):
+    """
+    AI service whose clients are out of budget once a call is under way
+
+    The service-wide limiter still has room, so requests get past the
+    up-front check and are turned away by the LLM client mid-call.
+    """
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("PREPWISE_CACHE", "0")
+    service = AIService()
+    service.ai.resume_parser.llm_client.rate_limiter = _exhausted_limiter()
+    service.ai.resume_parser.llm_client.count_tokens = Mock(return_value=500)
+    service.ai.question_generator.llm_client.rate_limiter = _exhausted_limiter()
+    return service
+
+
+def _assert_rate_limited(call) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(call)
+    assert exc_info.value.status_code == 429
+    assert int(exc_info.value.headers["Retry-After"]) > 0
+
+
+def test_evaluate_response_rate_limited(ai_service):
+    """Test an evaluation turned away mid-call is a 429, not a fallback score"""
+    _assert_rate_limited(ai_service.evaluate_response(
+        {"question": "What is a hash map?"}, "A key-value table.", "technical"
+    ))
+
+
+def test_generate_questions_rate_limited(ai_service):
+    """Test question generation turned away mid-call is a 429, not template questions"""
+    _assert_rate_limited(ai_service.generate_questions(
+        {}, interview_type="behavioral", num_questions=2
+    ))
+
+
+def test_parse_resume_rate_limited(ai_service):
+    """Test resume parsing turned away mid-call is a 429, not a 500"""
+    document = Document()
+    document.add_paragraph("John Doe, Software Engineer at Google since 2020. " * 3)
+    resume = io.BytesIO()
+    document.save(resume)
+    resume.seek(0)
+
+    _assert_rate_limited(ai_service.parse_resume_from_upload(
+        UploadFile(file=resume, filename="resume.docx")
+    ))
@@ -0,0 +1,49 @@
+"""
+Tests for caching of single-answer evaluations
+"""
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("pydantic_settings")
+
+from app.core.cache import cache_manager
+from app.services.ai_service import AIService
+
+
+@pytest.fixture
+def ai_service(monkeypatch):
+    """AI service with an empty cache that records what gets stored"""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("PREPWISE_CACHE", "0")
+    monkeypatch.setattr(cache_manager, "get", AsyncMock(return_value=None))
+    monkeypatch.setattr(cache_manager, "setex", AsyncMock())
+    return AIService()
+
+
+def _evaluate(ai_service):
+    return asyncio.run(ai_service.evaluate_response(
+        {"question": "What is a hash map?"}, "A key-value table.", "technical"
+    ))
+
+
+def test_evaluation_is_cached(ai_service):
+    """Test an LLM evaluation is cached for identical resubmissions"""
+    ai_service.ai.answer_evaluator.llm_client.generate_json = Mock(
+        return_value={"overall_score": 82, "score_level": "good"}
+    )
+
+    assert _evaluate(ai_service)["score"] == 82
+    cache_manager.setex.assert_awaited_once()
+
+
+def test_fallback_evaluation_is_not_cached(ai_service):
+    """Test a rule-based score from a failed LLM call is returned but not cached"""
+    ai_service.ai.answer_evaluator.llm_client.generate_json = Mock(
+        side_effect=RuntimeError("provider down")
+    )
+
+    assert _evaluate(ai_service)["score"] >= 0
+    cache_manager.setex.assert_not_awaited()